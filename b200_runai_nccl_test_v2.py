@@ -26,6 +26,31 @@ import re
 from datetime import datetime
 
 
+GPUS_PER_NODE = 8
+
+# InfiniBand interfaces attached to every worker, in the order their
+# SR-IOV networks are listed in the pod annotation
+IB_IFACES = (
+    "ibp192s0", "ibp206s0", "ibp154s0", "ibp220s0",
+    "ibp24s0", "ibp64s0", "ibp79s0", "ibp94s0",
+)
+
+IB_NETWORKS_ANNOTATION = "k8s.v1.cni.cncf.io/networks=" + ",".join(
+    f"network-operator/{iface}-sriovnet" for iface in IB_IFACES
+)
+
+# One IB resource per interface for each worker
+EXTENDED_RESOURCE_ARGS = tuple(
+    arg for iface in IB_IFACES for arg in ("--extended-resource", f"nvidia.com/res{iface}=1")
+)
+
+# No NCCL tuning variables are forwarded in this version; NCCL defaults apply
+NCCL_EXPORTED_VARS = ()
+NCCL_DEBUG_VARS = ("NCCL_DEBUG", "NCCL_DEBUG_SUBSYS")
+
+ALL_REDUCE_TEST_ARGS = ("all_reduce_perf_mpi", "-b", "1G", "-e", "16G", "-f", "2", "-n", "100", "-g", "1")
+
+
 def get_next_job_number(project_name):
     """
     Get the next job number by checking existing NCCL test workloads.
@@ -209,6 +234,27 @@ def capture_logs_for_job(namespace, job_name, num_nodes):
     time.sleep(2)
 
 
+def build_master_args(total_processes, debug=False):
+    """
+    Build the mpirun arguments passed to the launcher with --master-args.
+    
+    Args:
+        total_processes: Number of MPI ranks (one per GPU)
+        debug: Also forward the NCCL debug variables
+    
+    Returns:
+        The arguments as a single space-separated string
+    """
+    exported_vars = NCCL_DEBUG_VARS + NCCL_EXPORTED_VARS if debug else NCCL_EXPORTED_VARS
+    return " ".join((
+        "--allow-run-as-root", "--bind-to", "none", "-map-by", "slot",
+        "-np", str(total_processes),
+        *(arg for var in exported_vars for arg in ("-x", var)),
+        "-mca", "pml", "ob1", "-mca", "btl", "self,tcp",
+        *ALL_REDUCE_TEST_ARGS,
+    ))
+
+
 def run_nccl_test(project_name, num_nodes, debug=False):
     """
     Run NCCL test using RunAI MPI submit command.
@@ -236,38 +282,23 @@ def run_nccl_test(project_name, num_nodes, debug=False):
     
     print(f"\nJob name for this run: {job_name}")
     
-    # Calculate total number of processes (num_nodes * 8 GPUs per node)
-    total_processes = num_nodes * 8
+    # Calculate total number of processes (one per GPU on every node)
+    total_processes = num_nodes * GPUS_PER_NODE
     
     # Build the MPI submit command
     submit_cmd = [
         "runai", "mpi", "submit", job_name,
         "-i", "docker.io/deepops/nccl-tests:2312",
         "--workers", str(num_nodes),
-        "--gpu-devices-request", "8",
-        "--extended-resource", "nvidia.com/resibp24s0=1",
-        "--extended-resource", "nvidia.com/resibp64s0=1",
-        "--extended-resource", "nvidia.com/resibp79s0=1",
-        "--extended-resource", "nvidia.com/resibp94s0=1",
-        "--extended-resource", "nvidia.com/resibp154s0=1",
-        "--extended-resource", "nvidia.com/resibp192s0=1",
-        "--extended-resource", "nvidia.com/resibp206s0=1",
-        "--extended-resource", "nvidia.com/resibp220s0=1",
+        "--gpu-devices-request", str(GPUS_PER_NODE),
+        *EXTENDED_RESOURCE_ARGS,
         "--large-shm",
         "--stdin",
         "--tty",
         "--master-command", "mpirun",
-        "--master-args", (
-            f"--allow-run-as-root --bind-to none -map-by slot -np {total_processes} "
-            f"{'-x NCCL_DEBUG -x NCCL_DEBUG_SUBSYS ' if debug else ''}"
-            "-mca pml ob1 -mca btl self,tcp all_reduce_perf_mpi -b 1G -e 16G -f 2 -n 100 -g 1"
-        ),
+        "--master-args", build_master_args(total_processes, debug),
         "--image-pull-policy", "IfNotPresent",
-        "--annotation", (
-            "k8s.v1.cni.cncf.io/networks=network-operator/ibp192s0-sriovnet,network-operator/ibp206s0-sriovnet,"
-            "network-operator/ibp154s0-sriovnet,network-operator/ibp220s0-sriovnet,network-operator/ibp24s0-sriovnet,"
-            "network-operator/ibp64s0-sriovnet,network-operator/ibp79s0-sriovnet,network-operator/ibp94s0-sriovnet"
-        ),
+        "--annotation", IB_NETWORKS_ANNOTATION,
     ]
     
     # Add debug settings if enabled
@@ -284,19 +315,34 @@ def run_nccl_test(project_name, num_nodes, debug=False):
         print("Debug mode: DISABLED (using NCCL defaults)")
     print(f"Command: {' '.join(submit_cmd)}\n")
     
+    # Stream the submit output as it arrives instead of buffering it all
     try:
-        result = subprocess.run(submit_cmd, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        print("\nNCCL test submitted successfully!")
-        
-        # Start capturing logs from the job pods
-        namespace = f"runai-{project_name}"
-        capture_logs_for_job(namespace, job_name, num_nodes)
-        
-        return 0
-    except subprocess.CalledProcessError as e:
-        print(f"Error submitting NCCL test: {e.stderr}", file=sys.stderr)
+        process = subprocess.Popen(
+            submit_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+    except OSError as e:
+        print(f"Error submitting NCCL test: {e}", file=sys.stderr)
         return 1
+    
+    for line in process.stdout:
+        print(line, end="")
+    process.wait()
+    
+    if process.returncode != 0:
+        print(f"Error submitting NCCL test: runai exited with code {process.returncode}", file=sys.stderr)
+        return 1
+    
+    print("\nNCCL test submitted successfully!")
+    
+    # Start capturing logs from the job pods
+    namespace = f"runai-{project_name}"
+    capture_logs_for_job(namespace, job_name, num_nodes)
+    
+    return 0
 
 
 def main():
@@ -0,0 +1,44 @@
+"""
+Shared helpers for the health check scripts in this directory.
+
+Scripts import this module by name; Python adds the script's own directory
+to sys.path, so it resolves when running e.g.:
+    python3 healthchecks/healthcheck_ingress-nginx.py
+"""
+
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+def print_header(title):
+    """Print a formatted test header."""
+    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
+    print(f"{Colors.BOLD}{Colors.BLUE}{title}{Colors.END}")
+    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
+
+
+def print_summary(results, success_message):
+    """Print the pass/fail summary for a results dict and return the exit code."""
+    print_header("Test Summary")
+
+    passed = sum(1 for v in results.values() if v)
+    total = len(results)
+
+    print(f"Tests Passed: {passed}/{total}")
+    print(f"Tests Failed: {total - passed}/{total}")
+
+    if passed == total:
+        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ All tests PASSED!{Colors.END}")
+        print(f"{Colors.GREEN}{success_message}{Colors.END}\n")
+        return 0
+    else:
+        print(f"\n{Colors.RED}{Colors.BOLD}✗ Some tests FAILED!{Colors.END}")
+        print(f"{Colors.RED}Please review the failed tests above.{Colors.END}\n")
+        return 1
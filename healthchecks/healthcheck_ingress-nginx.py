@@ -15,51 +15,96 @@ Tests:
 7. TLS Certificate Verification (via Run:AI hostname)
 8. Controller Configuration Validation
 
+Requirements:
+    python3-cryptography (certificate parsing)
+    orjson (optional, faster parsing of kubectl JSON output)
+
 Usage:
     python3 healthcheck_ingress-nginx.py
 """
 
+import base64
 import subprocess
 import json
 import sys
 import re
+import socket
+import ssl
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.x509.oid import NameOID
+
+from healthcheck_common import Colors, print_header, print_summary
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Semantic version in an image tag, e.g. ":v1.13.0"
+VERSION_PATTERN = re.compile(r':v?(\d+\.\d+\.\d+)')
 
-class Colors:
-    """ANSI color codes for terminal output."""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+# Shared by the certificate parsers in tests 5 and 7 (required by cryptography < 3.1)
+CERT_BACKEND = default_backend()
 
 
 def run_command(cmd, capture_output=True, text=True):
-    """Execute a shell command and return the result."""
+    """Execute a command (argv list, no shell) and return the result."""
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
             capture_output=capture_output,
             text=text,
             timeout=30
         )
         return result
     except subprocess.TimeoutExpired:
-        print(f"{Colors.RED}✗ Command timed out: {cmd}{Colors.END}")
+        print(f"{Colors.RED}✗ Command timed out: {' '.join(cmd)}{Colors.END}")
         return None
     except Exception as e:
         print(f"{Colors.RED}✗ Error executing command: {e}{Colors.END}")
         return None
 
 
-def print_header(title):
-    """Print a formatted test header."""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{title}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
+def parse_json(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def fetch_json(cmd):
+    """Run a kubectl command and parse its JSON output, or return None on failure."""
+    # Keep stdout as bytes: both orjson and json accept them, so decoding to str is wasted work
+    result = run_command(cmd, text=False)
+    if not result or result.returncode != 0:
+        return None
+    try:
+        return parse_json(result.stdout)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+        print(f"{Colors.RED}✗ Failed to parse kubectl output: {' '.join(cmd)}{Colors.END}")
+        return None
+
+
+def prefetch_cluster_state():
+    """Fetch every resource the tests need concurrently, parsing each response once."""
+    commands = {
+        'pods': ["kubectl", "get", "pods", "-n", "ingress-nginx",
+                 "-l", "app.kubernetes.io/component=controller", "-o", "json"],
+        'services': ["kubectl", "get", "svc", "-n", "ingress-nginx", "-o", "json"],
+        'secret': ["kubectl", "get", "secret", "ingress-server-default-tls",
+                   "-n", "ingress-nginx", "-o", "json"],
+        'deployment': ["kubectl", "get", "deployment", "ingress-nginx-controller",
+                       "-n", "ingress-nginx", "-o", "json"],
+        'ingresses': ["kubectl", "get", "ingress", "-A", "-o", "json"],
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        futures = {key: executor.submit(fetch_json, cmd) for key, cmd in commands.items()}
+        return {key: future.result() for key, future in futures.items()}
 
 
 def print_test_result(test_num, test_name, passed, message=""):
@@ -72,152 +117,196 @@ def print_test_result(test_num, test_name, passed, message=""):
     print()
 
 
-def test_controller_pods():
+def tcp_probe(host, port, timeout=5):
+    """Return True if a TCP connection to host:port can be established."""
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+def get_certificate_names(cert):
+    """Return the subject CN and SAN DNS names of an x509 certificate."""
+    cn_attrs = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+    cn = cn_attrs[0].value if cn_attrs else None
+    
+    try:
+        san_ext = cert.extensions.get_extension_for_class(x509.SubjectAlternativeName)
+        sans = san_ext.value.get_values_for_type(x509.DNSName)
+    except x509.ExtensionNotFound:
+        sans = []
+    
+    return cn, sans
+
+
+def certificate_matches_host(cert, hostname):
+    """Check whether the certificate CN or a SAN DNS name covers hostname."""
+    cn, sans = get_certificate_names(cert)
+    hostname = hostname.lower()
+    
+    for name in [cn] + sans:
+        if not name:
+            continue
+        name = name.lower()
+        if name == hostname:
+            return True
+        # Wildcard names cover exactly one extra label (*.example.com)
+        if name.startswith('*.') and hostname.split('.', 1)[-1] == name[2:]:
+            return True
+    return False
+
+
+def fetch_server_certificate(host, port, timeout=10):
+    """Retrieve the certificate presented by host:port (SNI, no verification)."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=host) as tls_sock:
+            der = tls_sock.getpeercert(binary_form=True)
+    
+    return x509.load_der_x509_certificate(der, CERT_BACKEND)
+
+
+def format_certificate_info(cert):
+    """Format certificate subject, issuer, SANs and validity dates for display."""
+    _, sans = get_certificate_names(cert)
+    # cryptography >= 42 exposes timezone-aware *_utc properties
+    if hasattr(cert, 'not_valid_after_utc'):
+        not_before, not_after = cert.not_valid_before_utc, cert.not_valid_after_utc
+    else:
+        not_before, not_after = cert.not_valid_before, cert.not_valid_after
+    lines = [
+        f"  • Subject: {cert.subject.rfc4514_string()}",
+        f"  • Issuer: {cert.issuer.rfc4514_string()}",
+        f"  • SANs: {', '.join(sans) if sans else 'none'}",
+        f"  • Not Before: {not_before}",
+        f"  • Not After: {not_after}"
+    ]
+    return "\n".join(lines)
+
+
+def test_controller_pods(pods_data):
     """Test 1: Check ingress-nginx controller pods are running."""
     print_test_result(1, "Ingress-NGINX Controller Pods", None, "Checking...")
     
-    cmd = "kubectl get pods -n ingress-nginx -l app.kubernetes.io/component=controller -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if pods_data is None:
         print_test_result(1, "Ingress-NGINX Controller Pods", False, 
                          "Failed to get controller pods")
         return False
     
-    try:
-        data = json.loads(result.stdout)
-        pods = data.get('items', [])
-        
-        if not pods:
-            print_test_result(1, "Ingress-NGINX Controller Pods", False,
-                             "No ingress-nginx controller pods found")
-            return False
-        
-        running_pods = 0
-        ready_pods = 0
-        pod_details = []
+    pods = pods_data.get('items', [])
+    
+    if not pods:
+        print_test_result(1, "Ingress-NGINX Controller Pods", False,
+                         "No ingress-nginx controller pods found")
+        return False
+    
+    running_pods = 0
+    ready_pods = 0
+    pod_details = []
+    
+    for pod in pods:
+        status = pod['status']
+        name = pod['metadata']['name']
+        phase = status.get('phase', 'Unknown')
         
-        for pod in pods:
-            name = pod['metadata']['name']
-            phase = pod['status'].get('phase', 'Unknown')
-            
-            # Check if pod is ready
-            conditions = pod['status'].get('conditions', [])
-            is_ready = False
-            for condition in conditions:
-                if condition['type'] == 'Ready' and condition['status'] == 'True':
-                    is_ready = True
-                    break
-            
-            if phase == 'Running':
-                running_pods += 1
-            if is_ready:
-                ready_pods += 1
-            
-            pod_details.append(f"  • {name}: {phase}, Ready: {is_ready}")
+        # Check if pod is ready
+        conditions = status.get('conditions', [])
+        is_ready = any(c.get('type') == 'Ready' and c.get('status') == 'True'
+                       for c in conditions)
         
-        total_pods = len(pods)
-        details = f"Found {total_pods} controller pod(s): {running_pods} running, {ready_pods} ready\n" + "\n".join(pod_details)
+        if phase == 'Running':
+            running_pods += 1
+        if is_ready:
+            ready_pods += 1
         
-        if running_pods == total_pods and ready_pods == total_pods:
-            print_test_result(1, "Ingress-NGINX Controller Pods", True, details)
-            return True
-        else:
-            print_test_result(1, "Ingress-NGINX Controller Pods", False, details)
-            return False
-            
-    except json.JSONDecodeError:
-        print_test_result(1, "Ingress-NGINX Controller Pods", False,
-                         "Failed to parse kubectl output")
+        pod_details.append(f"  • {name}: {phase}, Ready: {is_ready}")
+    
+    total_pods = len(pods)
+    details = f"Found {total_pods} controller pod(s): {running_pods} running, {ready_pods} ready\n" + "\n".join(pod_details)
+    
+    if running_pods == total_pods and ready_pods == total_pods:
+        print_test_result(1, "Ingress-NGINX Controller Pods", True, details)
+        return True
+    else:
+        print_test_result(1, "Ingress-NGINX Controller Pods", False, details)
         return False
 
 
-def test_service_status():
+def test_service_status(services_data):
     """Test 2: Check ingress-nginx service status."""
     print_test_result(2, "Ingress-NGINX Service Status", None, "Checking...")
     
-    cmd = "kubectl get svc -n ingress-nginx -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if services_data is None:
         print_test_result(2, "Ingress-NGINX Service Status", False,
                          "Failed to get ingress-nginx services")
         return False
     
-    try:
-        data = json.loads(result.stdout)
-        services = data.get('items', [])
-        
-        required_services = ['ingress-nginx-controller', 'ingress-nginx-controller-admission']
-        found_services = {}
-        
-        for svc in services:
-            name = svc['metadata']['name']
-            if name in required_services:
-                svc_type = svc['spec']['type']
-                cluster_ip = svc['spec'].get('clusterIP', 'None')
-                ports = svc['spec'].get('ports', [])
-                port_info = [f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in ports]
-                
-                found_services[name] = {
-                    'type': svc_type,
-                    'clusterIP': cluster_ip,
-                    'ports': ', '.join(port_info)
-                }
-        
-        # Check for LoadBalancer service (optional, for Run:AI)
-        for svc in services:
-            name = svc['metadata']['name']
-            if svc['spec']['type'] == 'LoadBalancer':
-                external_ips = svc['status'].get('loadBalancer', {}).get('ingress', [])
-                if external_ips:
-                    lb_ip = external_ips[0].get('ip', 'Pending')
-                    found_services[name] = {
-                        'type': 'LoadBalancer',
-                        'externalIP': lb_ip,
-                        'clusterIP': svc['spec'].get('clusterIP', 'None')
-                    }
-        
-        details_list = []
-        for svc_name, info in found_services.items():
-            if 'externalIP' in info:
-                details_list.append(f"  • {svc_name}: {info['type']}, External IP: {info['externalIP']}")
-            else:
-                details_list.append(f"  • {svc_name}: {info['type']}, ClusterIP: {info['clusterIP']}, Ports: {info['ports']}")
-        
-        details = f"Found {len(found_services)} service(s):\n" + "\n".join(details_list)
-        
-        if all(svc in found_services for svc in required_services):
-            print_test_result(2, "Ingress-NGINX Service Status", True, details)
-            return True
-        else:
-            missing = [svc for svc in required_services if svc not in found_services]
-            print_test_result(2, "Ingress-NGINX Service Status", False,
-                             f"Missing required services: {', '.join(missing)}\n{details}")
-            return False
+    services = services_data.get('items', [])
+    
+    required_services = ['ingress-nginx-controller', 'ingress-nginx-controller-admission']
+    found_services = {}
+    
+    for svc in services:
+        name = svc['metadata']['name']
+        spec = svc['spec']
+        
+        # LoadBalancer services with an external IP are reported by address
+        # (optional, for Run:AI); this includes the controller if exposed that way
+        external_ips = []
+        if spec['type'] == 'LoadBalancer':
+            external_ips = svc['status'].get('loadBalancer', {}).get('ingress', [])
+        
+        if external_ips:
+            found_services[name] = {
+                'type': 'LoadBalancer',
+                'externalIP': external_ips[0].get('ip', 'Pending'),
+                'clusterIP': spec.get('clusterIP', 'None')
+            }
+        elif name in required_services:
+            ports = spec.get('ports', [])
+            port_info = [f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in ports]
             
-    except json.JSONDecodeError:
+            found_services[name] = {
+                'type': spec['type'],
+                'clusterIP': spec.get('clusterIP', 'None'),
+                'ports': ', '.join(port_info)
+            }
+    
+    details_list = []
+    for svc_name, info in found_services.items():
+        if 'externalIP' in info:
+            details_list.append(f"  • {svc_name}: {info['type']}, External IP: {info['externalIP']}")
+        else:
+            details_list.append(f"  • {svc_name}: {info['type']}, ClusterIP: {info['clusterIP']}, Ports: {info['ports']}")
+    
+    details = f"Found {len(found_services)} service(s):\n" + "\n".join(details_list)
+    
+    if all(svc in found_services for svc in required_services):
+        print_test_result(2, "Ingress-NGINX Service Status", True, details)
+        return True
+    else:
+        missing = [svc for svc in required_services if svc not in found_services]
         print_test_result(2, "Ingress-NGINX Service Status", False,
-                         "Failed to parse kubectl output")
+                         f"Missing required services: {', '.join(missing)}\n{details}")
         return False
 
 
-def test_default_tls_certificate():
+def test_default_tls_certificate(secret_data, deployment_data):
     """Test 3: Check default TLS certificate configuration."""
     print_test_result(3, "Default TLS Certificate Configuration", None, "Checking...")
     
     # Check if secret exists
-    cmd = "kubectl get secret ingress-server-default-tls -n ingress-nginx -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if secret_data is None:
         print_test_result(3, "Default TLS Certificate Configuration", False,
                          "Secret 'ingress-server-default-tls' not found in ingress-nginx namespace")
         return False
     
     try:
-        data = json.loads(result.stdout)
-        secret_type = data.get('type', '')
+        secret_type = secret_data.get('type', '')
         
         if secret_type != 'kubernetes.io/tls':
             print_test_result(3, "Default TLS Certificate Configuration", False,
@@ -225,25 +314,18 @@ def test_default_tls_certificate():
             return False
         
         # Check controller is configured to use it
-        cmd = "kubectl get deployment ingress-nginx-controller -n ingress-nginx -o json"
-        result = run_command(cmd)
-        
-        if not result or result.returncode != 0:
+        if deployment_data is None:
             print_test_result(3, "Default TLS Certificate Configuration", False,
                              "Failed to get controller deployment")
             return False
         
-        deployment_data = json.loads(result.stdout)
         containers = deployment_data['spec']['template']['spec']['containers']
         
-        cert_arg_found = False
-        for container in containers:
-            if container['name'] == 'controller':
-                args = container.get('args', [])
-                for arg in args:
-                    if '--default-ssl-certificate=' in arg and 'ingress-server-default-tls' in arg:
-                        cert_arg_found = True
-                        break
+        cert_arg_found = any(
+            '--default-ssl-certificate=' in arg and 'ingress-server-default-tls' in arg
+            for container in containers if container['name'] == 'controller'
+            for arg in container.get('args', [])
+        )
         
         if cert_arg_found:
             print_test_result(3, "Default TLS Certificate Configuration", True,
@@ -256,134 +338,106 @@ def test_default_tls_certificate():
                              "Secret exists but controller is not configured to use it")
             return False
             
-    except (json.JSONDecodeError, KeyError) as e:
+    except KeyError as e:
         print_test_result(3, "Default TLS Certificate Configuration", False,
                          f"Failed to parse configuration: {e}")
         return False
 
 
-def test_ingress_resources():
+def test_ingress_resources(ingress_data):
     """Test 4: Check for ingress resources."""
     print_test_result(4, "Ingress Resources Discovery", None, "Checking...")
     
-    cmd = "kubectl get ingress -A -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if ingress_data is None:
         print_test_result(4, "Ingress Resources Discovery", False,
                          "Failed to get ingress resources")
         return False, {}
     
-    try:
-        data = json.loads(result.stdout)
-        ingresses = data.get('items', [])
-        
-        if not ingresses:
-            print_test_result(4, "Ingress Resources Discovery", False,
-                             "No ingress resources found in cluster")
-            return False, {}
-        
-        ingress_info = {}
-        details_list = []
-        
-        for ingress in ingresses:
-            namespace = ingress['metadata']['namespace']
-            name = ingress['metadata']['name']
-            hosts = []
-            tls_hosts = []
-            
-            # Get hosts from rules
-            rules = ingress['spec'].get('rules', [])
-            for rule in rules:
-                if 'host' in rule:
-                    hosts.append(rule['host'])
-            
-            # Get TLS hosts
-            tls_configs = ingress['spec'].get('tls', [])
-            for tls in tls_configs:
-                tls_hosts.extend(tls.get('hosts', []))
-                secret_name = tls.get('secretName', 'default')
-            
-            ingress_class = ingress['spec'].get('ingressClassName', 'not-set')
-            
-            key = f"{namespace}/{name}"
-            ingress_info[key] = {
-                'hosts': hosts,
-                'tls_hosts': tls_hosts,
-                'class': ingress_class
-            }
-            
-            details_list.append(f"  • {namespace}/{name}:")
-            details_list.append(f"    - Hosts: {', '.join(hosts) if hosts else 'none'}")
-            details_list.append(f"    - TLS: {', '.join(tls_hosts) if tls_hosts else 'none'}")
-            details_list.append(f"    - Class: {ingress_class}")
-        
-        details = f"Found {len(ingresses)} ingress resource(s):\n" + "\n".join(details_list)
-        print_test_result(4, "Ingress Resources Discovery", True, details)
-        return True, ingress_info
-        
-    except json.JSONDecodeError:
+    ingresses = ingress_data.get('items', [])
+    
+    if not ingresses:
         print_test_result(4, "Ingress Resources Discovery", False,
-                         "Failed to parse kubectl output")
+                         "No ingress resources found in cluster")
         return False, {}
+    
+    ingress_info = {}
+    details_list = []
+    
+    for ingress in ingresses:
+        namespace = ingress['metadata']['namespace']
+        name = ingress['metadata']['name']
+        hosts = []
+        tls_hosts = []
+        
+        # Get hosts from rules
+        rules = ingress['spec'].get('rules', [])
+        for rule in rules:
+            if 'host' in rule:
+                hosts.append(rule['host'])
+        
+        # Get TLS hosts
+        tls_configs = ingress['spec'].get('tls', [])
+        for tls in tls_configs:
+            tls_hosts.extend(tls.get('hosts', []))
+            secret_name = tls.get('secretName', 'default')
+        
+        ingress_class = ingress['spec'].get('ingressClassName', 'not-set')
+        
+        key = f"{namespace}/{name}"
+        ingress_info[key] = {
+            'hosts': hosts,
+            'tls_hosts': tls_hosts,
+            'class': ingress_class
+        }
+        
+        details_list.append(f"  • {namespace}/{name}:")
+        details_list.append(f"    - Hosts: {', '.join(hosts) if hosts else 'none'}")
+        details_list.append(f"    - TLS: {', '.join(tls_hosts) if tls_hosts else 'none'}")
+        details_list.append(f"    - Class: {ingress_class}")
+    
+    details = f"Found {len(ingresses)} ingress resource(s):\n" + "\n".join(details_list)
+    print_test_result(4, "Ingress Resources Discovery", True, details)
+    return True, ingress_info
 
 
-def test_certificate_domain():
+def test_certificate_domain(secret_data):
     """Test 5: Validate certificate is for correct domain (not ingress.local)."""
     print_test_result(5, "Certificate Domain Validation", None, "Checking...")
     
-    cmd = "kubectl get secret ingress-server-default-tls -n ingress-nginx -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if secret_data is None:
         print_test_result(5, "Certificate Domain Validation", False,
                          "Cannot retrieve TLS certificate secret")
         return False, None
     
     try:
-        data = json.loads(result.stdout)
-        cert_data = data['data'].get('tls.crt', '')
+        cert_data = secret_data['data'].get('tls.crt', '')
         
         if not cert_data:
             print_test_result(5, "Certificate Domain Validation", False,
                              "No certificate data found in secret")
             return False, None
         
-        # Decode and check certificate
-        import base64
-        import tempfile
-        
+        # Decode and parse the certificate in-process
         cert_decoded = base64.b64decode(cert_data)
         
-        # Write to temp file and use openssl to extract subject
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.crt') as f:
-            f.write(cert_decoded)
-            cert_file = f.name
-        
-        cmd = f"openssl x509 -in {cert_file} -noout -subject -issuer -dates 2>/dev/null"
-        result = run_command(cmd)
-        
-        # Clean up temp file
-        import os
-        os.unlink(cert_file)
-        
-        if not result or result.returncode != 0:
+        try:
+            cert = x509.load_pem_x509_certificate(cert_decoded, CERT_BACKEND)
+        except ValueError:
             print_test_result(5, "Certificate Domain Validation", False,
-                             "Failed to parse certificate with openssl")
+                             "Failed to parse certificate data")
             return False, None
         
-        cert_info = result.stdout
+        cn, sans = get_certificate_names(cert)
+        cert_info = format_certificate_info(cert)
         
         # Check if it's the default ingress.local certificate
-        if 'ingress.local' in cert_info.lower():
+        if any('ingress.local' in name.lower() for name in [cn] + sans if name):
             print_test_result(5, "Certificate Domain Validation", False,
                              f"Certificate is for default 'ingress.local' domain!\n{cert_info}\n"
                              "ACTION REQUIRED: Run 'cm-kubernetes-setup' and select 'Configure Ingress'")
             return False, None
         
-        # Extract CN or SANs
-        cn_match = re.search(r'CN\s*=\s*([^,\n]+)', cert_info)
-        domain = cn_match.group(1).strip() if cn_match else "unknown"
+        domain = cn or (sans[0] if sans else "unknown")
         
         print_test_result(5, "Certificate Domain Validation", True,
                          f"Certificate is properly configured:\n{cert_info}")
@@ -420,10 +474,7 @@ def test_ingress_connectivity(ingress_info):
         return False, None
     
     # Test HTTPS connectivity (just check if port is open)
-    cmd = f"timeout 5 bash -c 'echo > /dev/tcp/{runai_host}/443' 2>/dev/null"
-    result = run_command(cmd)
-    
-    if result and result.returncode == 0:
+    if tcp_probe(runai_host, 443):
         print_test_result(6, "Ingress Endpoint Connectivity", True,
                          f"Successfully connected to {runai_host}:443")
         return True, runai_host
@@ -442,19 +493,19 @@ def test_tls_verification(hostname):
                          "No hostname available for testing (skipped)")
         return False
     
-    # Use openssl to check the certificate
-    cmd = f"timeout 10 openssl s_client -connect {hostname}:443 -servername {hostname} < /dev/null 2>/dev/null | openssl x509 -noout -subject -issuer -dates 2>/dev/null"
-    result = run_command(cmd)
+    hostname = hostname.replace('https://', '').replace('http://', '')
     
-    if not result or result.returncode != 0:
+    try:
+        cert = fetch_server_certificate(hostname, 443)
+    except (OSError, ValueError):
         print_test_result(7, "TLS Certificate Verification", False,
                          f"Failed to retrieve certificate from {hostname}:443")
         return False
     
-    cert_info = result.stdout.strip()
+    cert_info = format_certificate_info(cert)
     
     # Check if certificate matches the hostname
-    if hostname.replace('https://', '').replace('http://', '') in cert_info:
+    if certificate_matches_host(cert, hostname):
         print_test_result(7, "TLS Certificate Verification", True,
                          f"Certificate verified for {hostname}:\n{cert_info}")
         return True
@@ -464,23 +515,18 @@ def test_tls_verification(hostname):
         return False
 
 
-def test_controller_configuration():
+def test_controller_configuration(deployment_data):
     """Test 8: Validate controller configuration."""
     print_test_result(8, "Controller Configuration Validation", None, "Checking...")
     
-    cmd = "kubectl get deployment ingress-nginx-controller -n ingress-nginx -o json"
-    result = run_command(cmd)
-    
-    if not result or result.returncode != 0:
+    if deployment_data is None:
         print_test_result(8, "Controller Configuration Validation", False,
                          "Failed to get controller deployment")
         return False
     
     try:
-        data = json.loads(result.stdout)
-        
         # Check image version
-        containers = data['spec']['template']['spec']['containers']
+        containers = deployment_data['spec']['template']['spec']['containers']
         controller_container = None
         for container in containers:
             if container['name'] == 'controller':
@@ -496,7 +542,7 @@ def test_controller_configuration():
         args = controller_container.get('args', [])
         
         # Extract version from image
-        version_match = re.search(r':v?(\d+\.\d+\.\d+)', image)
+        version_match = VERSION_PATTERN.search(image)
         version = version_match.group(1) if version_match else "unknown"
         
         # Check for key configuration arguments
@@ -507,13 +553,13 @@ def test_controller_configuration():
         }
         
         for arg in args:
-            for key in key_args.keys():
-                if arg.startswith(key):
-                    key_args[key] = True
+            flag = arg.split('=', 1)[0]
+            if flag in key_args:
+                key_args[flag] = True
         
         # Check replicas
-        replicas = data['spec'].get('replicas', 0)
-        available_replicas = data['status'].get('availableReplicas', 0)
+        replicas = deployment_data['spec'].get('replicas', 0)
+        available_replicas = deployment_data['status'].get('availableReplicas', 0)
         
         details_list = [
             f"  • Image: {image}",
@@ -546,7 +592,7 @@ def test_controller_configuration():
                              f"{details}\n\nIssues: {'; '.join(issues)}")
             return False
             
-    except (json.JSONDecodeError, KeyError) as e:
+    except KeyError as e:
         print_test_result(8, "Controller Configuration Validation", False,
                          f"Failed to parse configuration: {e}")
         return False
@@ -560,33 +606,20 @@ def main():
     
     results = {}
     
+    # Fetch all cluster state up front; the tests work on the parsed data
+    state = prefetch_cluster_state()
+    
     # Run tests
-    results['test1'] = test_controller_pods()
-    results['test2'] = test_service_status()
-    results['test3'] = test_default_tls_certificate()
-    results['test4'], ingress_info = test_ingress_resources()
-    results['test5'], cert_domain = test_certificate_domain()
+    results['test1'] = test_controller_pods(state['pods'])
+    results['test2'] = test_service_status(state['services'])
+    results['test3'] = test_default_tls_certificate(state['secret'], state['deployment'])
+    results['test4'], ingress_info = test_ingress_resources(state['ingresses'])
+    results['test5'], cert_domain = test_certificate_domain(state['secret'])
     results['test6'], hostname = test_ingress_connectivity(ingress_info)
     results['test7'] = test_tls_verification(hostname)
-    results['test8'] = test_controller_configuration()
-    
-    # Summary
-    print_header("Test Summary")
+    results['test8'] = test_controller_configuration(state['deployment'])
     
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
-    print(f"Tests Passed: {passed}/{total}")
-    print(f"Tests Failed: {total - passed}/{total}")
-    
-    if passed == total:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ All tests PASSED!{Colors.END}")
-        print(f"{Colors.GREEN}Ingress-NGINX controller is healthy and properly configured.{Colors.END}\n")
-        return 0
-    else:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ Some tests FAILED!{Colors.END}")
-        print(f"{Colors.RED}Please review the failed tests above.{Colors.END}\n")
-        return 1
+    return print_summary(results, "Ingress-NGINX controller is healthy and properly configured.")
 
 
 if __name__ == "__main__":
@@ -10,6 +10,10 @@ Prerequisites:
 - kubectl configured with cluster admin access
 - Passwordless SSH access to DGX nodes
 - Python 3.6+
+- Optional: kubernetes Python client (reuses one API server connection instead
+  of starting kubectl for every query)
+- Optional: ijson (streams large list responses instead of loading them whole)
+- Optional: orjson (faster parsing of JSON responses)
 
 Usage:
     python3 healthcheck_network-operator.py [--nodes NODE1,NODE2,...]
@@ -20,13 +24,51 @@ Example:
 """
 
 import argparse
+import atexit
+import functools
+import http.client
+import shutil
+import socket
 import subprocess
 import sys
 import json
+import os
 import re
-from typing import Dict, List, Tuple, Optional
+import select
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
+from urllib.parse import urlencode
+
+try:
+    import ijson
+    JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_ERRORS = (ValueError,)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from kubernetes import client as k8s_client, config as k8s_config
+except ImportError:
+    k8s_client = None
+
+
+# The 8 InfiniBand interfaces on each B200 node; the SR-IOV resource and NAD
+# names the network operator creates are derived from them
+IB_IFACES = (
+    "ibp24s0", "ibp64s0", "ibp79s0", "ibp94s0",
+    "ibp154s0", "ibp192s0", "ibp206s0", "ibp220s0",
+)
+EXPECTED_RESOURCES = tuple(f"nvidia.com/res{iface}" for iface in IB_IFACES)
+EXPECTED_NADS = tuple(f"{iface}-sriovnet" for iface in IB_IFACES)
 
 
 class Status(Enum):
@@ -45,14 +87,28 @@ class CheckResult:
     details: Optional[str] = None
 
 
+# Only emit ANSI escapes to a terminal, so piped output and log files stay
+# clean, and honour the NO_COLOR convention
+USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+
 class Colors:
-    """ANSI color codes for terminal output."""
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    """ANSI color codes for terminal output (empty when color is disabled)."""
+    GREEN = '\033[92m' if USE_COLOR else ''
+    YELLOW = '\033[93m' if USE_COLOR else ''
+    RED = '\033[91m' if USE_COLOR else ''
+    BLUE = '\033[94m' if USE_COLOR else ''
+    BOLD = '\033[1m' if USE_COLOR else ''
+    END = '\033[0m' if USE_COLOR else ''
+
+
+# Colored status label for each result, built once
+STATUS_PREFIX = {
+    Status.PASS: f"{Colors.GREEN}{Status.PASS.value}{Colors.END}",
+    Status.WARN: f"{Colors.YELLOW}{Status.WARN.value}{Colors.END}",
+    Status.FAIL: f"{Colors.RED}{Status.FAIL.value}{Colors.END}",
+    Status.INFO: f"{Colors.BLUE}{Status.INFO.value}{Colors.END}",
+}
 
 
 def print_section(title: str):
@@ -65,17 +121,7 @@ def print_section(title: str):
 def print_result(result: CheckResult, indent: int = 0):
     """Print a check result with appropriate formatting."""
     prefix = "  " * indent
-    
-    # Color mapping
-    color_map = {
-        Status.PASS: Colors.GREEN,
-        Status.WARN: Colors.YELLOW,
-        Status.FAIL: Colors.RED,
-        Status.INFO: Colors.BLUE,
-    }
-    
-    color = color_map.get(result.status, "")
-    print(f"{prefix}{color}{result.status.value}{Colors.END} {result.message}")
+    print(f"{prefix}{STATUS_PREFIX[result.status]} {result.message}")
     
     if result.details:
         for line in result.details.split('\n'):
@@ -83,7 +129,8 @@ def print_result(result: CheckResult, indent: int = 0):
                 print(f"{prefix}    {line}")
 
 
-def run_command(cmd: List[str], capture_output=True, check=False) -> Tuple[int, str, str]:
+def run_command(cmd: List[str], capture_output=True, check=False, text=True,
+                capture_stderr=False) -> Tuple[int, Any, str]:
     """
     Run a command and return exit code, stdout, stderr.
     
@@ -91,22 +138,372 @@ def run_command(cmd: List[str], capture_output=True, check=False) -> Tuple[int,
         cmd: Command and arguments as list
         capture_output: Whether to capture output
         check: Whether to raise exception on non-zero exit
+        text: Whether to decode stdout; pass False to get the raw bytes for
+              parse_json. stderr is always decoded.
+        capture_stderr: Whether to capture stderr as well; when False (and
+              capture_output is set) it is discarded and returned as ""
         
     Returns:
         Tuple of (exit_code, stdout, stderr)
     """
+    if not capture_output:
+        stdout_dest = stderr_dest = None
+    else:
+        stdout_dest = subprocess.PIPE
+        stderr_dest = subprocess.PIPE if capture_stderr else subprocess.DEVNULL
+    
     try:
         result = subprocess.run(
             cmd,
-            capture_output=capture_output,
-            text=True,
+            stdout=stdout_dest,
+            stderr=stderr_dest,
             check=check
         )
-        return result.returncode, result.stdout, result.stderr
     except subprocess.CalledProcessError as e:
-        return e.returncode, e.stdout if e.stdout else "", e.stderr if e.stderr else ""
+        result = e
     except Exception as e:
-        return 1, "", str(e)
+        return 1, "" if text else b"", str(e)
+    
+    stdout = result.stdout or b""
+    stderr = result.stderr or b""
+    return result.returncode, stdout.decode(errors="replace") if text else stdout, stderr.decode(errors="replace")
+
+
+def parse_json(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# How API reads reach the server, chosen once by init_api_backend(): a shared
+# kubernetes ApiClient, else a local "kubectl proxy" (socket path in PROXY_SOCKET).
+# While both are None every read starts its own kubectl process.
+API_CLIENT = None
+PROXY_SOCKET = None
+REQUEST_TIMEOUT = 30
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to a Unix domain socket instead of TCP."""
+    
+    def __init__(self, socket_path: str, timeout: int):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def start_kubectl_proxy() -> Optional[str]:
+    """
+    Start "kubectl proxy" on a private Unix socket and return its path.
+    
+    The proxy keeps one authenticated connection to the API server open for
+    the whole run, so each request only costs a local round trip. It forwards
+    with the caller's credentials, so it listens on a socket inside a 0700
+    temporary directory rather than a TCP port other local users could reach.
+    It is stopped at exit. Returns None if the proxy does not come up.
+    """
+    socket_dir = tempfile.mkdtemp(prefix="kubectl-proxy-")
+    socket_path = os.path.join(socket_dir, "proxy.sock")
+    atexit.register(shutil.rmtree, socket_dir, ignore_errors=True)
+    
+    try:
+        proc = subprocess.Popen(
+            ["kubectl", "proxy", f"--unix-socket={socket_path}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+    except OSError:
+        return None
+    atexit.register(proc.terminate)
+    
+    # kubectl prints "Starting to serve on <socket>" once it is listening
+    ready, _, _ = select.select([proc.stdout], [], [], 10)
+    line = proc.stdout.readline() if ready else ""
+    if socket_path not in line:
+        proc.terminate()
+        return None
+    
+    # Keep reading whatever the proxy logs later so it never blocks on a full pipe
+    def drain_output():
+        for _ in proc.stdout:
+            pass
+    
+    threading.Thread(target=drain_output, daemon=True).start()
+    return socket_path
+
+
+def init_api_backend(request_timeout: int):
+    """
+    Set up the shared API connection for this run.
+    
+    Uses the kubernetes package when it is installed and kubeconfig loads,
+    otherwise a kubectl proxy; if neither is available reads fall back to
+    one kubectl process per request.
+    
+    Args:
+        request_timeout: Timeout in seconds for each API request
+    """
+    global API_CLIENT, PROXY_SOCKET, REQUEST_TIMEOUT
+    REQUEST_TIMEOUT = request_timeout
+    
+    if k8s_client is not None:
+        try:
+            k8s_config.load_kube_config()
+            API_CLIENT = k8s_client.ApiClient()
+            return
+        except Exception:
+            pass
+    
+    PROXY_SOCKET = start_kubectl_proxy()
+
+
+def has_api_connection() -> bool:
+    """Whether API reads go over the shared connection rather than kubectl."""
+    return API_CLIENT is not None or PROXY_SOCKET is not None
+
+
+def api_url(path: str, label_selector: Optional[str] = None) -> str:
+    """Append the label selector query, if any, to an API path."""
+    if label_selector:
+        return f"{path}?{urlencode({'labelSelector': label_selector})}"
+    return path
+
+
+def open_api_response(path: str, label_selector: Optional[str] = None):
+    """
+    Issue a GET for an API path over the shared connection.
+    
+    The response is returned unread so callers can stream it; raises on
+    HTTP or connection errors.
+    """
+    if API_CLIENT is None:
+        connection = UnixHTTPConnection(PROXY_SOCKET, REQUEST_TIMEOUT)
+        connection.request("GET", api_url(path, label_selector))
+        response = connection.getresponse()
+        # Hand the socket over to the response, which releases it on close;
+        # connection.close() would close the unread response as well
+        if connection.sock is not None:
+            connection.sock.close()
+            connection.sock = None
+        if response.status != 200:
+            body = response.read().decode(errors="replace").strip()
+            response.close()
+            raise OSError(f"HTTP {response.status}: {body}")
+        return response
+    
+    query = [("labelSelector", label_selector)] if label_selector else []
+    return API_CLIENT.call_api(
+        path, "GET",
+        query_params=query,
+        auth_settings=["BearerToken"],
+        _preload_content=False,
+        _return_http_data_only=True,
+        _request_timeout=REQUEST_TIMEOUT
+    )
+
+
+def kubectl_raw_command(path: str, label_selector: Optional[str] = None) -> List[str]:
+    """Build the kubectl command that GETs an API path."""
+    return [
+        "kubectl", "get", "--raw", api_url(path, label_selector),
+        f"--request-timeout={REQUEST_TIMEOUT}s"
+    ]
+
+
+def kube_get(path: str, label_selector: Optional[str] = None) -> Tuple[int, bytes, str]:
+    """
+    GET a Kubernetes API path, e.g. /api/v1/nodes.
+    
+    Goes over the shared API connection when there is one and falls back to
+    kubectl get --raw.
+    
+    Args:
+        path: API path to fetch
+        label_selector: Optional label selector for list requests
+        
+    Returns:
+        Tuple of (exit_code, response body as bytes for parse_json, error)
+    """
+    if not has_api_connection():
+        return run_command(kubectl_raw_command(path, label_selector), text=False, capture_stderr=True)
+    
+    try:
+        response = open_api_response(path, label_selector)
+        try:
+            return 0, response.read(), ""
+        finally:
+            response.close()
+    except Exception as e:
+        return 1, b"", str(e)
+
+
+def run_command_stream(cmd: List[str], consume: Callable[[IO[bytes]], Any]) -> Tuple[int, Any, str]:
+    """
+    Run a command and let consume() read its stdout pipe as it is produced.
+    
+    Unlike run_command, the output is never held in memory as a whole unless
+    consume() chooses to read it that way.
+    
+    Args:
+        cmd: Command and arguments as list
+        consume: Function reading the binary stdout stream and returning a result
+        
+    Returns:
+        Tuple of (exit_code, result of consume or None if the command failed, stderr)
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        return 1, None, str(e)
+    
+    result = consume(proc.stdout)
+    # Drain whatever is left so the command can exit, and collect stderr
+    _, stderr = proc.communicate()
+    stderr = stderr.decode(errors="replace")
+    
+    if proc.returncode != 0:
+        return proc.returncode, None, stderr
+    return proc.returncode, result, stderr
+
+
+def parse_list_items(stream: IO[bytes], extract: Callable[[dict], Any]) -> Optional[List[Any]]:
+    """
+    Parse a Kubernetes List document from a binary stream.
+    
+    With ijson installed the items are parsed one at a time, so only what
+    extract returns is kept in memory rather than the whole list document.
+    
+    Returns:
+        List of extract(item) per item, or None if the document is unparseable
+    """
+    try:
+        if ijson is not None:
+            return [extract(item) for item in ijson.items(stream, "items.item", use_float=True)]
+        return [extract(item) for item in parse_json(stream.read()).get("items", [])]
+    except JSON_ERRORS + (KeyError,):
+        return None
+
+
+def kube_list(path: str, extract: Callable[[dict], Any],
+              label_selector: Optional[str] = None) -> Tuple[int, Optional[List[Any]], str]:
+    """
+    List a Kubernetes API collection and return only the fields needed from each item.
+    
+    The response is parsed straight off the shared API connection or the
+    kubectl pipe instead of being buffered first.
+    
+    Args:
+        path: API path of the collection, e.g. /api/v1/nodes
+        extract: Function mapping one item to the value to keep
+        label_selector: Optional label selector
+        
+    Returns:
+        Tuple of (exit_code, extracted items or None if unparseable, error)
+    """
+    if not has_api_connection():
+        return run_command_stream(
+            kubectl_raw_command(path, label_selector),
+            lambda stdout: parse_list_items(stdout, extract)
+        )
+    
+    try:
+        response = open_api_response(path, label_selector)
+    except Exception as e:
+        return 1, None, str(e)
+    
+    try:
+        return 0, parse_list_items(response, extract), ""
+    except OSError as e:
+        return 1, None, str(e)
+    finally:
+        response.close()
+
+
+# The pod checks all look at the same small namespace, so it is listed once
+# and each check filters that list. The lock makes concurrent checks wait for
+# the first list call instead of each issuing their own.
+_pods_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _list_network_operator_pods() -> Tuple[int, Optional[List[Tuple[str, str, Dict[str, str]]]], str]:
+    return kube_list(
+        "/api/v1/namespaces/network-operator/pods",
+        lambda pod: (
+            pod["metadata"]["name"],
+            pod["status"].get("phase") or "Unknown",
+            pod["metadata"].get("labels") or {}
+        )
+    )
+
+
+def get_network_operator_pods() -> Tuple[int, Optional[List[Tuple[str, str, Dict[str, str]]]], str]:
+    """
+    List the pods in the network-operator namespace once per run.
+    
+    Returns:
+        Tuple of (exit_code, list of (name, phase, labels) or None if
+        unparseable, stderr)
+    """
+    with _pods_lock:
+        return _list_network_operator_pods()
+
+
+def get_pod_phases(label_selector: str) -> Tuple[int, Optional[List[Tuple[str, str]]], str]:
+    """
+    Get the name and phase of network-operator pods matching a label selector.
+    
+    Args:
+        label_selector: Single key=value label to match
+        
+    Returns:
+        Tuple of (exit_code, list of (name, phase) or None if unparseable, stderr)
+    """
+    key, _, value = label_selector.partition("=")
+    exit_code, pods, stderr = get_network_operator_pods()
+    if pods is None:
+        return exit_code, None, stderr
+    
+    matching = [(name, phase) for name, phase, labels in pods if labels.get(key) == value]
+    return exit_code, matching, stderr
+
+
+@functools.lru_cache(maxsize=1)
+def get_gpu_node_allocatable() -> Optional[Tuple[Tuple[str, Dict[str, str]], ...]]:
+    """
+    List all GPU nodes once per run.
+    
+    Returns:
+        Tuple of (node name, allocatable resources) pairs, or None if the
+        node list could not be fetched
+    """
+    exit_code, items, stderr = kube_list(
+        "/api/v1/nodes",
+        lambda item: (item["metadata"]["name"], item.get("status", {}).get("allocatable", {})),
+        "nvidia.com/gpu.present=true"
+    )
+    return tuple(items) if items is not None else None
+
+
+def get_gpu_nodes() -> Tuple[str, ...]:
+    """Get the names of all GPU nodes (nvidia.com/gpu.present=true)."""
+    return tuple(name for name, _ in get_gpu_node_allocatable() or ())
+
+
+# Multiplex all SSH sessions to a node over one master connection so only the
+# first command pays for the TCP handshake, key exchange and authentication
+SSH_MUX_OPTIONS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o", "ControlPersist=60s",
+]
 
 
 def run_ssh_command(node: str, cmd: str) -> Tuple[int, str, str]:
@@ -120,14 +517,21 @@ def run_ssh_command(node: str, cmd: str) -> Tuple[int, str, str]:
     Returns:
         Tuple of (exit_code, stdout, stderr)
     """
-    ssh_cmd = ["ssh", "-o", "StrictHostKeyChecking=no", node, cmd]
+    ssh_cmd = ["ssh", "-o", "StrictHostKeyChecking=no"] + SSH_MUX_OPTIONS + [node, cmd]
     return run_command(ssh_cmd)
 
 
+def close_ssh_master(node: str):
+    """Close the multiplexed SSH master connection to a node, if one is open."""
+    run_command(["ssh"] + SSH_MUX_OPTIONS + ["-O", "exit", node])
+
+
 def check_network_operator_deployment() -> CheckResult:
     """Check if Network Operator is deployed via Helm."""
     exit_code, stdout, stderr = run_command(
-        ["helm", "list", "-n", "network-operator", "-o", "json"]
+        ["helm", "list", "-n", "network-operator", "-o", "json"],
+        text=False,
+        capture_stderr=True
     )
     
     if exit_code != 0:
@@ -138,7 +542,7 @@ def check_network_operator_deployment() -> CheckResult:
         )
     
     try:
-        releases = json.loads(stdout)
+        releases = parse_json(stdout)
         network_op = [r for r in releases if r.get("name") == "network-operator"]
         
         if not network_op:
@@ -169,56 +573,45 @@ def check_network_operator_deployment() -> CheckResult:
 
 def check_operator_pods() -> CheckResult:
     """Check if Network Operator controller pods are running."""
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "pods", "-n", "network-operator",
-        "-l", "app.kubernetes.io/name=network-operator",
-        "-o", "json"
-    ])
+    exit_code, pods, stderr = get_pod_phases("app.kubernetes.io/name=network-operator")
     
     if exit_code != 0:
         return CheckResult(Status.FAIL, "Failed to query operator pods", stderr)
     
-    try:
-        pods = json.loads(stdout)
-        items = pods.get("items", [])
-        
-        if not items:
-            return CheckResult(Status.FAIL, "No Network Operator pods found")
-        
-        running = 0
-        total = len(items)
-        details = []
-        
-        for pod in items:
-            name = pod["metadata"]["name"]
-            phase = pod["status"].get("phase", "Unknown")
-            
-            if phase == "Running":
-                running += 1
-            else:
-                details.append(f"Pod {name}: {phase}")
-        
-        if running == total:
-            return CheckResult(
-                Status.PASS,
-                f"Network Operator pods running ({running}/{total})"
-            )
+    if pods is None:
+        return CheckResult(Status.FAIL, "Failed to parse pod status")
+    
+    if not pods:
+        return CheckResult(Status.FAIL, "No Network Operator pods found")
+    
+    running = 0
+    total = len(pods)
+    details = []
+    
+    for name, phase in pods:
+        if phase == "Running":
+            running += 1
         else:
-            return CheckResult(
-                Status.FAIL,
-                f"Not all operator pods running ({running}/{total})",
-                '\n'.join(details) if details else None
-            )
-    except (json.JSONDecodeError, KeyError) as e:
-        return CheckResult(Status.FAIL, f"Failed to parse pod status: {e}")
+            details.append(f"Pod {name}: {phase}")
+    
+    if running == total:
+        return CheckResult(
+            Status.PASS,
+            f"Network Operator pods running ({running}/{total})"
+        )
+    else:
+        return CheckResult(
+            Status.FAIL,
+            f"Not all operator pods running ({running}/{total})",
+            '\n'.join(details) if details else None
+        )
 
 
 def check_nic_cluster_policy() -> CheckResult:
     """Check NicClusterPolicy exists and is ready."""
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "nicclusterpolicies.mellanox.com",
-        "nic-cluster-policy", "-o", "json"
-    ])
+    exit_code, stdout, stderr = kube_get(
+        "/apis/mellanox.com/v1alpha1/nicclusterpolicies/nic-cluster-policy"
+    )
     
     if exit_code != 0:
         return CheckResult(
@@ -228,7 +621,7 @@ def check_nic_cluster_policy() -> CheckResult:
         )
     
     try:
-        policy = json.loads(stdout)
+        policy = parse_json(stdout)
         status = policy.get("status", {})
         state = status.get("state", "unknown")
         applied_states = status.get("appliedStates", [])
@@ -264,12 +657,70 @@ def check_nic_cluster_policy() -> CheckResult:
         return CheckResult(Status.FAIL, f"Failed to parse NicClusterPolicy: {e}")
 
 
+SRIOV_NODE_STATES_PATH = "/apis/sriovnetwork.openshift.io/v1/namespaces/network-operator/sriovnetworknodestates"
+
+# Up to this many --nodes, fetching each node's state by name is cheaper than
+# listing every SriovNetworkNodeState in the cluster and filtering locally
+SRIOV_PER_NODE_MAX = 8
+
+
+# A 404 as reported by each kube_get backend: kubectl, the kubernetes
+# package's ApiException and the proxy connection. Anchored on the status so
+# a message body that happens to mention 404 does not count.
+_NOT_FOUND_RE = re.compile(r"\A(?:\(404\)|HTTP 404:)|^Error from server \(NotFound\)", re.MULTILINE)
+
+
+def is_not_found(error: str) -> bool:
+    """Whether a kube_get error means the requested object does not exist."""
+    return _NOT_FOUND_RE.search(error) is not None
+
+
+def get_sriov_sync_status(node: str) -> Tuple[int, Optional[str], str]:
+    """
+    Get the syncStatus of one node's SriovNetworkNodeState.
+    
+    Returns:
+        Tuple of (exit_code, syncStatus or None if the node has no state, error)
+    """
+    exit_code, stdout, stderr = kube_get(f"{SRIOV_NODE_STATES_PATH}/{node}")
+    if exit_code != 0:
+        if is_not_found(stderr):
+            return 0, None, ""
+        return exit_code, None, stderr
+    
+    try:
+        return 0, parse_json(stdout).get("status", {}).get("syncStatus", "Unknown"), ""
+    except ValueError as e:
+        return 1, None, f"Failed to parse SR-IOV state: {e}"
+
+
 def check_sriov_network_node_states(nodes: List[str]) -> CheckResult:
     """Check SR-IOV network node states for specified nodes."""
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "sriovnetworknodestate",
-        "-n", "network-operator", "-o", "json"
-    ])
+    if nodes and len(nodes) <= SRIOV_PER_NODE_MAX:
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            results = list(executor.map(get_sriov_sync_status, nodes))
+        
+        errors = [
+            f"{node}: {stderr.strip()}"
+            for node, (exit_code, _, stderr) in zip(nodes, results) if exit_code != 0
+        ]
+        if errors:
+            return CheckResult(
+                Status.FAIL,
+                "Failed to query SriovNetworkNodeState resources",
+                '\n'.join(errors)
+            )
+        
+        # Nodes without a state are skipped, as they would be when filtering
+        # the full list
+        return summarize_sriov_node_states([
+            (node, status) for node, (_, status, _) in zip(nodes, results) if status is not None
+        ])
+    
+    exit_code, items, stderr = kube_list(
+        SRIOV_NODE_STATES_PATH,
+        lambda item: (item["metadata"]["name"], item.get("status", {}).get("syncStatus", "Unknown"))
+    )
     
     if exit_code != 0:
         return CheckResult(
@@ -278,112 +729,97 @@ def check_sriov_network_node_states(nodes: List[str]) -> CheckResult:
             stderr
         )
     
-    try:
-        states = json.loads(stdout)
-        items = states.get("items", [])
-        
-        if not items:
-            return CheckResult(
-                Status.FAIL,
-                "No SriovNetworkNodeState resources found"
-            )
-        
-        details = []
-        failed_nodes = []
-        
-        for item in items:
-            node_name = item["metadata"]["name"]
-            
-            # Skip if not in target nodes list
-            if nodes and node_name not in nodes:
-                continue
-            
-            status = item.get("status", {})
-            sync_status = status.get("syncStatus", "Unknown")
-            
-            if sync_status == "Succeeded":
-                details.append(f"  {node_name}: {sync_status}")
-            else:
-                details.append(f"  {node_name}: {sync_status}")
-                failed_nodes.append(node_name)
-        
-        if failed_nodes:
-            return CheckResult(
-                Status.FAIL,
-                f"SR-IOV configuration not succeeded on {len(failed_nodes)} node(s)",
-                '\n'.join(details)
-            )
-        
-        if not details:
-            return CheckResult(
-                Status.WARN,
-                "No matching nodes found in SriovNetworkNodeState"
-            )
-        
+    if items is None:
+        return CheckResult(Status.FAIL, "Failed to parse SR-IOV states")
+    
+    if not items:
         return CheckResult(
-            Status.PASS,
-            f"SR-IOV configuration succeeded on {len(details)} node(s)",
+            Status.FAIL,
+            "No SriovNetworkNodeState resources found"
+        )
+    
+    # Skip states for nodes outside the target nodes list
+    return summarize_sriov_node_states([
+        (node_name, sync_status) for node_name, sync_status in items
+        if not nodes or node_name in nodes
+    ])
+
+
+def summarize_sriov_node_states(items: List[Tuple[str, str]]) -> CheckResult:
+    """Build the SR-IOV check result from (node name, syncStatus) pairs."""
+    details = []
+    failed_nodes = []
+    
+    for node_name, sync_status in items:
+        if sync_status == "Succeeded":
+            details.append(f"  {node_name}: {sync_status}")
+        else:
+            details.append(f"  {node_name}: {sync_status}")
+            failed_nodes.append(node_name)
+    
+    if failed_nodes:
+        return CheckResult(
+            Status.FAIL,
+            f"SR-IOV configuration not succeeded on {len(failed_nodes)} node(s)",
             '\n'.join(details)
         )
-    except (json.JSONDecodeError, KeyError) as e:
-        return CheckResult(Status.FAIL, f"Failed to parse SR-IOV states: {e}")
+    
+    if not details:
+        return CheckResult(
+            Status.WARN,
+            "No matching nodes found in SriovNetworkNodeState"
+        )
+    
+    return CheckResult(
+        Status.PASS,
+        f"SR-IOV configuration succeeded on {len(details)} node(s)",
+        '\n'.join(details)
+    )
 
 
 def check_ib_extended_resources(nodes: List[str]) -> CheckResult:
     """Check if InfiniBand extended resources are available on nodes."""
-    if not nodes:
-        exit_code, stdout, stderr = run_command([
-            "kubectl", "get", "nodes", "-l", "nvidia.com/gpu.present=true",
-            "-o", "jsonpath={.items[*].metadata.name}"
-        ])
-        if exit_code == 0:
-            nodes = stdout.strip().split()
+    # Fetch every node in a single list call and look nodes up by name,
+    # rather than issuing one "kubectl get node" per node
+    if nodes:
+        exit_code, items, stderr = kube_list(
+            "/api/v1/nodes",
+            lambda item: (item["metadata"]["name"], item.get("status", {}).get("allocatable", {}))
+        )
+    else:
+        items = get_gpu_node_allocatable()
+        nodes = list(get_gpu_nodes())
+    allocatable_by_node = dict(items) if items is not None else None
     
     if not nodes:
         return CheckResult(Status.WARN, "No nodes specified for checking")
     
-    expected_resources = [
-        "nvidia.com/resibp24s0",
-        "nvidia.com/resibp64s0",
-        "nvidia.com/resibp79s0",
-        "nvidia.com/resibp94s0",
-        "nvidia.com/resibp154s0",
-        "nvidia.com/resibp192s0",
-        "nvidia.com/resibp206s0",
-        "nvidia.com/resibp220s0",
-    ]
-    
     details = []
     failed_nodes = []
     
     for node in nodes:
-        exit_code, stdout, stderr = run_command([
-            "kubectl", "get", "node", node, "-o", "json"
-        ])
-        
-        if exit_code != 0:
+        if allocatable_by_node is None or node not in allocatable_by_node:
             details.append(f"  {node}: Failed to query")
             failed_nodes.append(node)
             continue
         
         try:
-            node_obj = json.loads(stdout)
-            allocatable = node_obj.get("status", {}).get("allocatable", {})
+            allocatable = allocatable_by_node[node]
             
-            found_resources = [r for r in expected_resources if r in allocatable]
+            found_resources = [r for r in EXPECTED_RESOURCES if r in allocatable]
             
-            if len(found_resources) == 8:
+            if len(found_resources) == len(EXPECTED_RESOURCES):
                 # Check if all have quantity 8
                 quantities = [int(allocatable.get(r, "0")) for r in found_resources]
                 if all(q == 8 for q in quantities):
-                    details.append(f"  {node}: All 8 IB resources available (8 VFs each)")
+                    details.append(f"  {node}: All {len(EXPECTED_RESOURCES)} IB resources available (8 VFs each)")
                 else:
                     details.append(f"  {node}: Resources present but incorrect quantities: {quantities}")
                     failed_nodes.append(node)
             else:
-                details.append(f"  {node}: Only {len(found_resources)}/8 IB resources found")
+                details.append(f"  {node}: Only {len(found_resources)}/{len(EXPECTED_RESOURCES)} IB resources found")
                 failed_nodes.append(node)
-        except (json.JSONDecodeError, KeyError) as e:
+        except ValueError:
             details.append(f"  {node}: Parse error")
             failed_nodes.append(node)
     
@@ -404,27 +840,24 @@ def check_ib_extended_resources(nodes: List[str]) -> CheckResult:
 def check_nv_ipam() -> CheckResult:
     """Check NV-IPAM deployment and configuration."""
     # Check nv-ipam node pods (DaemonSet)
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "pods", "-n", "network-operator",
-        "-l", "component=nv-ipam-node", "-o", "json"
-    ])
+    exit_code, pods, stderr = get_pod_phases("component=nv-ipam-node")
     
     if exit_code != 0:
         return CheckResult(Status.FAIL, "Failed to query nv-ipam pods", stderr)
     
+    if pods is None:
+        return CheckResult(Status.FAIL, "Failed to parse NV-IPAM status")
+    
     try:
-        pods = json.loads(stdout)
-        items = pods.get("items", [])
-        
-        if not items:
+        if not pods:
             return CheckResult(
                 Status.FAIL,
                 "NV-IPAM pods not found",
                 "Enable nvIpam in NicClusterPolicy with correct image name (nvidia-k8s-ipam)"
             )
         
-        running = sum(1 for p in items if p["status"].get("phase") == "Running")
-        total = len(items)
+        running = [phase for _, phase in pods].count("Running")
+        total = len(pods)
         
         if running != total:
             return CheckResult(
@@ -433,10 +866,9 @@ def check_nv_ipam() -> CheckResult:
             )
         
         # Check IPPools
-        exit_code, stdout, stderr = run_command([
-            "kubectl", "get", "ippools.nv-ipam.nvidia.com",
-            "-n", "network-operator", "-o", "json"
-        ])
+        exit_code, stdout, stderr = kube_get(
+            "/apis/nv-ipam.nvidia.com/v1alpha1/namespaces/network-operator/ippools"
+        )
         
         if exit_code != 0:
             return CheckResult(
@@ -445,7 +877,7 @@ def check_nv_ipam() -> CheckResult:
                 "IPPools may not be created yet"
             )
         
-        pools = json.loads(stdout)
+        pools = parse_json(stdout)
         pool_items = pools.get("items", [])
         
         if len(pool_items) != 8:
@@ -478,27 +910,24 @@ def check_nv_ipam() -> CheckResult:
 
 def check_rdma_device_plugin() -> CheckResult:
     """Check RDMA Shared Device Plugin deployment."""
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "pods", "-n", "network-operator",
-        "-l", "app=rdma-shared-dp", "-o", "json"
-    ])
+    exit_code, pods, stderr = get_pod_phases("app=rdma-shared-dp")
     
     if exit_code != 0:
         return CheckResult(Status.FAIL, "Failed to query RDMA device plugin pods", stderr)
     
+    if pods is None:
+        return CheckResult(Status.FAIL, "Failed to parse RDMA plugin status")
+    
     try:
-        pods = json.loads(stdout)
-        items = pods.get("items", [])
-        
-        if not items:
+        if not pods:
             return CheckResult(
                 Status.FAIL,
                 "RDMA Shared Device Plugin not found",
                 "Enable rdmaSharedDevicePlugin in NicClusterPolicy"
             )
         
-        running = sum(1 for p in items if p["status"].get("phase") == "Running")
-        total = len(items)
+        running = [phase for _, phase in pods].count("Running")
+        total = len(pods)
         
         if running != total:
             return CheckResult(
@@ -507,12 +936,10 @@ def check_rdma_device_plugin() -> CheckResult:
             )
         
         # Check for rdma resources on nodes
-        exit_code, stdout, stderr = run_command([
-            "kubectl", "get", "nodes", "-o", "json"
-        ])
+        exit_code, stdout, stderr = kube_get("/api/v1/nodes")
         
         if exit_code == 0:
-            nodes_obj = json.loads(stdout)
+            nodes_obj = parse_json(stdout)
             nodes_with_rdma = 0
             
             for node in nodes_obj.get("items", []):
@@ -545,39 +972,31 @@ def check_secondary_network_components() -> CheckResult:
     details = []
     all_running = True
     
+    # Components are matched by name against the shared pod list
+    exit_code, pods, stderr = get_network_operator_pods()
+    error = "Failed to query" if exit_code != 0 else "Parse error"
+    
     for name, label_value in components:
-        exit_code, stdout, stderr = run_command([
-            "kubectl", "get", "pods", "-n", "network-operator",
-            "-o", "json"
-        ])
+        if pods is None:
+            details.append(f"  {name}: {error}")
+            all_running = False
+            continue
         
-        if exit_code != 0:
-            details.append(f"  {name}: Failed to query")
+        # Filter pods by name pattern
+        component_phases = [phase for pod_name, phase, _ in pods if label_value in pod_name]
+        
+        if not component_phases:
+            details.append(f"  {name}: Not found")
             all_running = False
             continue
         
-        try:
-            pods = json.loads(stdout)
-            items = pods.get("items", [])
-            
-            # Filter pods by name pattern
-            component_pods = [p for p in items if label_value in p["metadata"]["name"]]
-            
-            if not component_pods:
-                details.append(f"  {name}: Not found")
-                all_running = False
-                continue
-            
-            running = sum(1 for p in component_pods if p["status"].get("phase") == "Running")
-            total = len(component_pods)
-            
-            if running == total:
-                details.append(f"  {name}: Running ({total} pod(s))")
-            else:
-                details.append(f"  {name}: {running}/{total} running")
-                all_running = False
-        except (json.JSONDecodeError, KeyError):
-            details.append(f"  {name}: Parse error")
+        running = component_phases.count("Running")
+        total = len(component_phases)
+        
+        if running == total:
+            details.append(f"  {name}: Running ({total} pod(s))")
+        else:
+            details.append(f"  {name}: {running}/{total} running")
             all_running = False
     
     if all_running:
@@ -596,21 +1015,9 @@ def check_secondary_network_components() -> CheckResult:
 
 def check_network_attachment_definitions() -> CheckResult:
     """Check that all required NADs exist."""
-    expected_nads = [
-        "ibp24s0-sriovnet",
-        "ibp64s0-sriovnet",
-        "ibp79s0-sriovnet",
-        "ibp94s0-sriovnet",
-        "ibp154s0-sriovnet",
-        "ibp192s0-sriovnet",
-        "ibp206s0-sriovnet",
-        "ibp220s0-sriovnet",
-    ]
-    
-    exit_code, stdout, stderr = run_command([
-        "kubectl", "get", "network-attachment-definitions",
-        "-n", "network-operator", "-o", "json"
-    ])
+    exit_code, stdout, stderr = kube_get(
+        "/apis/k8s.cni.cncf.io/v1/namespaces/network-operator/network-attachment-definitions"
+    )
     
     if exit_code != 0:
         return CheckResult(
@@ -620,16 +1027,18 @@ def check_network_attachment_definitions() -> CheckResult:
         )
     
     try:
-        nads = json.loads(stdout)
+        nads = parse_json(stdout)
         items = nads.get("items", [])
         
-        found_names = [item["metadata"]["name"] for item in items]
-        missing = [nad for nad in expected_nads if nad not in found_names]
+        found_names = {item["metadata"]["name"] for item in items}
+        # Walk the expected list rather than diffing sets so the missing NADs
+        # are always reported in the same order
+        missing = [nad for nad in EXPECTED_NADS if nad not in found_names]
         
         if not missing:
             return CheckResult(
                 Status.PASS,
-                f"All 8 Network Attachment Definitions found",
+                f"All {len(EXPECTED_NADS)} Network Attachment Definitions found",
                 f"  Namespace: network-operator"
             )
         else:
@@ -644,23 +1053,32 @@ def check_network_attachment_definitions() -> CheckResult:
 
 def check_node_vf_activation(node: str) -> CheckResult:
     """Check if VFs are activated on a node."""
-    interfaces = [
-        "ibp24s0", "ibp64s0", "ibp79s0", "ibp94s0",
-        "ibp154s0", "ibp192s0", "ibp206s0", "ibp220s0"
-    ]
-    
     details = []
     failed_ifaces = []
     
-    for iface in interfaces:
-        cmd = f"cat /sys/class/net/{iface}/device/sriov_numvfs 2>/dev/null"
-        exit_code, stdout, stderr = run_ssh_command(node, cmd)
+    # Read every interface's VF count in one SSH round trip, one iface=count
+    # line per interface
+    cmd = (
+        f"for i in {' '.join(IB_IFACES)}; do "
+        "printf '%s=%s\\n' $i $(cat /sys/class/net/$i/device/sriov_numvfs 2>/dev/null || echo missing); "
+        "done"
+    )
+    exit_code, stdout, stderr = run_ssh_command(node, cmd)
+    
+    vf_counts = {}
+    if exit_code == 0:
+        for line in stdout.splitlines():
+            iface, sep, value = line.partition('=')
+            if sep:
+                vf_counts[iface.strip()] = value.strip()
+    
+    for iface in IB_IFACES:
+        num_vfs = vf_counts.get(iface, "missing")
         
-        if exit_code != 0:
+        if num_vfs == "missing":
             details.append(f"  {iface}: Not found or inaccessible")
             failed_ifaces.append(iface)
         else:
-            num_vfs = stdout.strip()
             if num_vfs == "8":
                 details.append(f"  {iface}: {num_vfs} VFs active")
             else:
@@ -676,14 +1094,21 @@ def check_node_vf_activation(node: str) -> CheckResult:
     
     return CheckResult(
         Status.PASS,
-        f"{node}: All 8 IB interfaces have 8 VFs active",
+        f"{node}: All {len(IB_IFACES)} IB interfaces have 8 VFs active",
         '\n'.join(details)
     )
 
 
+# Each match is one ibstat line of interest, and match.lastgroup names which
+# kind: a CA header, a port header, a port state or a port base LID
+_IBSTAT_RE = re.compile(
+    r"(?m)^[ \t]*(?:CA '(?P<ca>[^']+)'|Port (?P<port>\d+):|State:\s*(?P<state>\S+)|Base lid:\s*(?P<lid>\S+))"
+)
+
+
 def check_node_ib_ports(node: str) -> CheckResult:
     """Check InfiniBand port status on a node."""
-    cmd = "ibstat 2>/dev/null | grep -E '(CA |Port |State:|base lid:)'"
+    cmd = "ibstat 2>/dev/null | grep -E '(CA |Port |State:|Base lid:)'"
     exit_code, stdout, stderr = run_ssh_command(node, cmd)
     
     if exit_code != 0:
@@ -693,42 +1118,37 @@ def check_node_ib_ports(node: str) -> CheckResult:
             "Ensure InfiniBand drivers are loaded"
         )
     
-    # Parse ibstat output
-    lines = stdout.strip().split('\n')
+    # Parse ibstat output as [ca, port, state, invalid lid or None] per port
     current_ca = None
     current_port = None
     port_states = []
     
-    for line in lines:
-        line = line.strip()
+    for match in _IBSTAT_RE.finditer(stdout):
+        kind = match.lastgroup
+        value = match.group(kind)
         
-        if line.startswith("CA '"):
-            current_ca = line.split("'")[1]
-        elif line.startswith("Port "):
-            current_port = line.split()[1].rstrip(':')
-        elif "State:" in line:
-            state = line.split("State:")[-1].strip()
+        if kind == "ca":
+            current_ca = value
+        elif kind == "port":
+            current_port = value
+        elif kind == "state":
             if current_ca and current_port:
-                port_states.append((current_ca, current_port, state))
-        elif "base lid:" in line:
-            lid = line.split("base lid:")[-1].strip()
-            # Check for invalid LID (0xffff or 65535)
-            if lid in ["0xffff", "65535"]:
-                port_states[-1] = port_states[-1] + (lid,)
+                port_states.append([current_ca, current_port, value, None])
+        # Check for invalid LID (0xffff or 65535)
+        elif value in ("0xffff", "65535") and port_states:
+            port_states[-1][3] = value
     
     details = []
     down_ports = []
     
-    for state_info in port_states:
-        if len(state_info) == 3:
-            ca, port, state = state_info
+    for ca, port, state, lid in port_states:
+        if lid is None:
             if state == "Active":
                 details.append(f"  {ca} port {port}: {state}")
             else:
                 details.append(f"  {ca} port {port}: {state} (expected Active)")
                 down_ports.append(f"{ca}:{port}")
-        elif len(state_info) == 4:
-            ca, port, state, lid = state_info
+        else:
             if state == "Active" and lid not in ["0xffff", "65535"]:
                 details.append(f"  {ca} port {port}: {state}, LID {lid}")
             else:
@@ -749,6 +1169,30 @@ def check_node_ib_ports(node: str) -> CheckResult:
     )
 
 
+def start_node_checks(nodes: List[str], concurrency: int) -> Dict[str, Tuple[Future, Future]]:
+    """
+    Start the VF activation and IB port checks for each node in the background.
+    
+    SSH checks are latency-bound, so they run concurrently on up to
+    concurrency threads.
+    
+    Returns:
+        Dict of node name to its (VF activation, IB ports) result futures,
+        in the order the nodes were given
+    """
+    if not nodes:
+        return {}
+    
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(nodes)))
+    futures = {
+        node: (executor.submit(check_node_vf_activation, node), executor.submit(check_node_ib_ports, node))
+        for node in nodes
+    }
+    # No more work is coming; the queued checks still run to completion
+    executor.shutdown(wait=False)
+    return futures
+
+
 def main():
     """Main health check execution."""
     parser = argparse.ArgumentParser(
@@ -776,8 +1220,36 @@ Examples:
         help="Skip SSH-based node checks (VF activation, IB port status)"
     )
     
+    parser.add_argument(
+        "--parallel-nodes",
+        action="store_true",
+        help="Start the SSH-based node checks alongside the cluster-level checks instead of after them"
+    )
+    
+    parser.add_argument(
+        "--request-timeout",
+        type=int,
+        default=30,
+        help="Timeout in seconds for each Kubernetes API request (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--ssh-concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of concurrent SSH sessions for node checks (default: 10, "
+             "matching the OpenSSH MaxStartups default)"
+    )
+    
     args = parser.parse_args()
     
+    if args.request_timeout < 1:
+        parser.error("--request-timeout must be at least 1")
+    if args.ssh_concurrency < 1:
+        parser.error("--ssh-concurrency must be at least 1")
+    
+    init_api_backend(args.request_timeout)
+    
     # Parse node list
     nodes = []
     if args.nodes:
@@ -796,106 +1268,86 @@ Examples:
     failed_checks = []
     warning_checks = []
     
-    # 1. Network Operator Deployment
-    print_section("1. Network Operator Deployment")
-    
-    result = check_network_operator_deployment()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("Network Operator Deployment")
-    
-    result = check_operator_pods()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("Network Operator Pods")
-    
-    result = check_nic_cluster_policy()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("NicClusterPolicy")
-    elif result.status == Status.WARN:
-        warning_checks.append("NicClusterPolicy")
-    
-    # 2. SR-IOV Configuration
-    print_section("2. SR-IOV Configuration")
-    
-    result = check_sriov_network_node_states(nodes)
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("SR-IOV Node States")
-    
-    result = check_ib_extended_resources(nodes)
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("IB Extended Resources")
-    
-    # 3. NV-IPAM
-    print_section("3. NV-IPAM Configuration")
-    
-    result = check_nv_ipam()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("NV-IPAM")
-    elif result.status == Status.WARN:
-        warning_checks.append("NV-IPAM")
-    
-    # 4. RDMA Device Plugin
-    print_section("4. RDMA Shared Device Plugin")
-    
-    result = check_rdma_device_plugin()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("RDMA Device Plugin")
-    
-    # 5. Secondary Network Components
-    print_section("5. Secondary Network Components (Multus, CNI, IPAM)")
-    
-    result = check_secondary_network_components()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("Secondary Network Components")
-    
-    # 6. Network Attachment Definitions
-    print_section("6. Network Attachment Definitions")
-    
-    result = check_network_attachment_definitions()
-    print_result(result)
-    if result.status == Status.FAIL:
-        failed_checks.append("Network Attachment Definitions")
+    # With --parallel-nodes the per-node SSH checks start now and run while
+    # the cluster-level checks below are in flight
+    node_futures = None
+    if not args.skip_ssh and args.parallel_nodes:
+        node_futures = start_node_checks(nodes or list(get_gpu_nodes()), args.ssh_concurrency)
+    
+    # Checks 1-6 are independent API server queries, so run them concurrently
+    # and print the results in section order once they are all in. Each check
+    # is (summary label, check, whether a WARN is listed in the summary).
+    sections = [
+        ("1. Network Operator Deployment", [
+            ("Network Operator Deployment", check_network_operator_deployment, False),
+            ("Network Operator Pods", check_operator_pods, False),
+            ("NicClusterPolicy", check_nic_cluster_policy, True),
+        ]),
+        ("2. SR-IOV Configuration", [
+            ("SR-IOV Node States", functools.partial(check_sriov_network_node_states, nodes), False),
+            ("IB Extended Resources", functools.partial(check_ib_extended_resources, nodes), False),
+        ]),
+        ("3. NV-IPAM Configuration", [
+            ("NV-IPAM", check_nv_ipam, True),
+        ]),
+        ("4. RDMA Shared Device Plugin", [
+            ("RDMA Device Plugin", check_rdma_device_plugin, False),
+        ]),
+        ("5. Secondary Network Components (Multus, CNI, IPAM)", [
+            ("Secondary Network Components", check_secondary_network_components, False),
+        ]),
+        ("6. Network Attachment Definitions", [
+            ("Network Attachment Definitions", check_network_attachment_definitions, False),
+        ]),
+    ]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [[executor.submit(check) for _, check, _ in checks] for _, checks in sections]
+    
+    for (title, checks), section_futures in zip(sections, futures):
+        print_section(title)
+        
+        for (label, _, track_warning), future in zip(checks, section_futures):
+            result = future.result()
+            print_result(result)
+            if result.status == Status.FAIL:
+                failed_checks.append(label)
+            elif track_warning and result.status == Status.WARN:
+                warning_checks.append(label)
     
     # 7. Node-level checks (via SSH)
     if not args.skip_ssh:
         print_section("7. Node-Level InfiniBand Configuration")
         
         # Resolve node list if not specified
-        if not nodes:
-            exit_code, stdout, stderr = run_command([
-                "kubectl", "get", "nodes", "-l", "nvidia.com/gpu.present=true",
-                "-o", "jsonpath={.items[*].metadata.name}"
-            ])
-            if exit_code == 0:
-                nodes = stdout.strip().split()
-        
-        if not nodes:
+        if node_futures is None:
+            node_futures = start_node_checks(nodes or list(get_gpu_nodes()), args.ssh_concurrency)
+        
+        if not node_futures:
             print_result(CheckResult(
                 Status.WARN,
                 "No GPU nodes found for SSH checks"
             ))
         else:
-            for node in nodes:
-                print(f"\n{Colors.BOLD}Node: {node}{Colors.END}")
-                
-                result = check_node_vf_activation(node)
-                print_result(result, indent=1)
-                if result.status == Status.FAIL:
-                    failed_checks.append(f"VF Activation ({node})")
-                
-                result = check_node_ib_ports(node)
-                print_result(result, indent=1)
-                if result.status == Status.FAIL:
-                    failed_checks.append(f"IB Ports ({node})")
-                elif result.status == Status.WARN:
-                    warning_checks.append(f"IB Ports ({node})")
+            # Report in node order once each node's results are in
+            try:
+                for node, (vf_future, ib_future) in node_futures.items():
+                    print(f"\n{Colors.BOLD}Node: {node}{Colors.END}")
+                    
+                    result = vf_future.result()
+                    print_result(result, indent=1)
+                    if result.status == Status.FAIL:
+                        failed_checks.append(f"VF Activation ({node})")
+                    
+                    result = ib_future.result()
+                    print_result(result, indent=1)
+                    if result.status == Status.FAIL:
+                        failed_checks.append(f"IB Ports ({node})")
+                    elif result.status == Status.WARN:
+                        warning_checks.append(f"IB Ports ({node})")
+            finally:
+                for node in node_futures:
+                    close_ssh_master(node)
     else:
         print_section("7. Node-Level Checks")
         print_result(CheckResult(
@@ -43,15 +43,7 @@ import requests
 from datetime import datetime
 from pathlib import Path
 
-
-class Colors:
-    """ANSI color codes for terminal output."""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+from healthcheck_common import Colors, print_header, print_summary
 
 
 def run_command(cmd, capture_output=True, text=True, timeout=30):
@@ -73,13 +65,6 @@ def run_command(cmd, capture_output=True, text=True, timeout=30):
         return None
 
 
-def print_header(title):
-    """Print a formatted test header."""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{title}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 80}{Colors.END}\n")
-
-
 def print_test_result(test_num, test_name, passed, message=""):
     """Print a formatted test result."""
     if passed is None:
@@ -732,6 +717,41 @@ def save_storage_config(config):
         print_warning(f"Could not save config to {config_path}: {e}")
 
 
+def load_storage_class_cache(cluster_id, max_age=3600):
+    """Load cached storage classes from configs/storage_cache.json if still fresh."""
+    cache_path = "configs/storage_cache.json"
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except Exception as e:
+        print_warning(f"Could not load cache from {cache_path}: {e}")
+        return None
+    
+    if cache.get('cluster_id') != cluster_id:
+        return None
+    if time.time() - cache.get('ts', 0) >= max_age:
+        return None
+    return cache.get('classes') or None
+
+
+def save_storage_class_cache(cluster_id, storage_classes):
+    """Save storage classes to configs/storage_cache.json."""
+    cache_path = "configs/storage_cache.json"
+    os.makedirs("configs", exist_ok=True)
+    cache = {
+        'ts': time.time(),
+        'cluster_id': cluster_id,
+        'classes': storage_classes
+    }
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        print_warning(f"Could not save cache to {cache_path}: {e}")
+
+
 def fetch_projects(runai_url, token):
     """Fetch all projects from Run:AI API."""
     url = f"{runai_url}/api/v1/org-unit/projects"
@@ -770,12 +790,45 @@ def fetch_storage_classes(runai_url, token, cluster_id):
         return []
 
 
-def interactive_config(runai_config, token):
-    """Interactively configure project and storage class."""
-    print_header("Interactive Configuration")
+def prompt_choice(prompt, count):
+    """Prompt until the user enters a number between 1 and count; return the 0-based index."""
+    while True:
+        value = input(prompt).strip()
+        if value.isdecimal() and 1 <= int(value) <= count:
+            return int(value) - 1
+        print_warning(f"Invalid input. Please enter a number between 1 and {count}")
+
+
+def interactive_config(runai_config, token, refresh=False, non_interactive=False):
+    """Interactively configure project and storage class.
+    
+    Storage classes are cached for an hour in configs/storage_cache.json;
+    pass refresh=True to bypass the cache and query the API.
     
+    With non_interactive=True the saved configs/storage.json is used as-is,
+    without prompting or calling the API. Returns None if it is incomplete.
+    """
     storage_config = load_storage_config()
     
+    if non_interactive:
+        required = ['PROJECT_NAME', 'PROJECT_ID', 'STORAGE_CLASS']
+        missing = [key for key in required if not storage_config.get(key)]
+        if missing:
+            print_warning(f"Saved configuration is missing: {', '.join(missing)}")
+            print_warning("Run once without --non-interactive to create configs/storage.json")
+            return None
+        
+        project_name = storage_config['PROJECT_NAME']
+        project_id = storage_config['PROJECT_ID']
+        storage_class = storage_config['STORAGE_CLASS']
+        print_info("Using saved configuration (non-interactive):")
+        print_info(f"  Project: {project_name} (ID: {project_id})")
+        print_info(f"  Storage Class: {storage_class}")
+        print()
+        return project_name, project_id, storage_class
+    
+    print_header("Interactive Configuration")
+    
     # Fetch and select project
     print_info("Fetching projects from Run:AI...")
     projects = fetch_projects(runai_config['RUNAI_URL'], token)
@@ -798,32 +851,23 @@ def interactive_config(runai_config, token):
                 project_id = storage_config['PROJECT_ID']
                 print_info(f"Using saved project: {project_name}")
             else:
-                while True:
-                    try:
-                        choice = int(input(f"\nSelect project (1-{len(projects)}): ")) - 1
-                        if 0 <= choice < len(projects):
-                            project_name, project_id = projects[choice]
-                            break
-                        else:
-                            print_warning(f"Please enter a number between 1 and {len(projects)}")
-                    except (ValueError, IndexError):
-                        print_warning(f"Invalid input. Please enter a number between 1 and {len(projects)}")
+                choice = prompt_choice(f"\nSelect project (1-{len(projects)}): ", len(projects))
+                project_name, project_id = projects[choice]
         else:
-            while True:
-                try:
-                    choice = int(input(f"\nSelect project (1-{len(projects)}): ")) - 1
-                    if 0 <= choice < len(projects):
-                        project_name, project_id = projects[choice]
-                        break
-                    else:
-                        print_warning(f"Please enter a number between 1 and {len(projects)}")
-                except (ValueError, IndexError):
-                    print_warning(f"Invalid input. Please enter a number between 1 and {len(projects)}")
+            choice = prompt_choice(f"\nSelect project (1-{len(projects)}): ", len(projects))
+            project_name, project_id = projects[choice]
     
     # Fetch and select storage class
     print()
-    print_info("Fetching storage classes from Run:AI...")
-    storage_classes = fetch_storage_classes(runai_config['RUNAI_URL'], token, runai_config['RUNAI_CLUSTER_ID'])
+    cluster_id = runai_config['RUNAI_CLUSTER_ID']
+    storage_classes = None if refresh else load_storage_class_cache(cluster_id)
+    if storage_classes:
+        print_info("Using cached storage classes (use --refresh to re-fetch)")
+    else:
+        print_info("Fetching storage classes from Run:AI...")
+        storage_classes = fetch_storage_classes(runai_config['RUNAI_URL'], token, cluster_id)
+        if storage_classes:
+            save_storage_class_cache(cluster_id, storage_classes)
     
     if not storage_classes:
         print_warning("No storage classes found via API. Using manual entry.")
@@ -841,27 +885,11 @@ def interactive_config(runai_config, token):
                 storage_class = storage_config['STORAGE_CLASS']
                 print_info(f"Using saved storage class: {storage_class}")
             else:
-                while True:
-                    try:
-                        choice = int(input(f"\nSelect storage class (1-{len(storage_classes)}): ")) - 1
-                        if 0 <= choice < len(storage_classes):
-                            storage_class = storage_classes[choice]
-                            break
-                        else:
-                            print_warning(f"Please enter a number between 1 and {len(storage_classes)}")
-                    except (ValueError, IndexError):
-                        print_warning(f"Invalid input. Please enter a number between 1 and {len(storage_classes)}")
+                choice = prompt_choice(f"\nSelect storage class (1-{len(storage_classes)}): ", len(storage_classes))
+                storage_class = storage_classes[choice]
         else:
-            while True:
-                try:
-                    choice = int(input(f"\nSelect storage class (1-{len(storage_classes)}): ")) - 1
-                    if 0 <= choice < len(storage_classes):
-                        storage_class = storage_classes[choice]
-                        break
-                    else:
-                        print_warning(f"Please enter a number between 1 and {len(storage_classes)}")
-                except (ValueError, IndexError):
-                    print_warning(f"Invalid input. Please enter a number between 1 and {len(storage_classes)}")
+            choice = prompt_choice(f"\nSelect storage class (1-{len(storage_classes)}): ", len(storage_classes))
+            storage_class = storage_classes[choice]
     
     # Save configuration
     config = {
@@ -1050,14 +1078,23 @@ Prerequisites:
     
     Project and storage class will be selected interactively.
     Your selections will be saved to configs/storage.json for future runs.
+    Storage classes are cached in configs/storage_cache.json for one hour.
+    Use --non-interactive to reuse the saved selections without prompting.
 
 Example:
     python3 healthcheck_storage.py
     python3 healthcheck_storage.py --dry-run
+    python3 healthcheck_storage.py --refresh
+    python3 healthcheck_storage.py --non-interactive
         """
     )
     parser.add_argument('--dry-run', action='store_true',
                         help='Generate curl commands without executing (saves to .logs/)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--refresh', action='store_true',
+                      help='Re-fetch storage classes from the API instead of using the cache')
+    mode.add_argument('--non-interactive', '--skip-prompts', action='store_true',
+                      help='Use the saved project and storage class without prompting (for CI)')
     
     args = parser.parse_args()
     
@@ -1088,7 +1125,12 @@ Example:
         return 1
     
     # Interactive configuration for project and storage class
-    project_name, project_id, storage_class = interactive_config(config, token)
+    selection = interactive_config(config, token, refresh=args.refresh,
+                                   non_interactive=args.non_interactive)
+    if selection is None:
+        print(f"\n{Colors.RED}Cannot proceed without a saved project and storage class.{Colors.END}\n")
+        return 1
+    project_name, project_id, storage_class = selection
     config['STORAGE_CLASS'] = storage_class
     config['PROJECT_NAME'] = project_name
     config['PROJECT_ID'] = project_id
@@ -1163,31 +1205,16 @@ Example:
         results['test8'] = False
         results['test9'] = False
     
-    # Summary
-    print_header("Test Summary")
+    exit_code = print_summary(results, "Storage system is healthy and properly cleaning up resources.")
     
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
-    print(f"Tests Passed: {passed}/{total}")
-    print(f"Tests Failed: {total - passed}/{total}")
+    # Check if we need manual cleanup
+    if exit_code and not results.get('test7') and asset_id:
+        print_warning("Manual cleanup may be required:")
+        print_warning(f"  Asset ID: {asset_id}")
+        print_warning(f"  Use Run:AI UI or API to delete the datasource")
+        print()
     
-    if passed == total:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ All tests PASSED!{Colors.END}")
-        print(f"{Colors.GREEN}Storage system is healthy and properly cleaning up resources.{Colors.END}\n")
-        return 0
-    else:
-        print(f"\n{Colors.RED}{Colors.BOLD}✗ Some tests FAILED!{Colors.END}")
-        print(f"{Colors.RED}Please review the failed tests above.{Colors.END}\n")
-        
-        # Check if we need manual cleanup
-        if not results.get('test7') and asset_id:
-            print_warning("Manual cleanup may be required:")
-            print_warning(f"  Asset ID: {asset_id}")
-            print_warning(f"  Use Run:AI UI or API to delete the datasource")
-            print()
-        
-        return 1
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -10,30 +10,148 @@ import json
 import re
 import os
 import argparse
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Optional
+import functools
+import hashlib
+import shlex
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional, Union
 from datetime import datetime
 
+try:
+    # orjson parses faster and takes the raw bytes of command output directly
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-def run_command(cmd: str, shell: bool = True, check: bool = False) -> Tuple[str, str, int]:
+# Projects each workload onto one tab-separated line so kubectl prints only
+# the fields used here: kind, namespace, images, labels (as JSON), name.
+# The name is never empty, so stripping the output cannot drop a field.
+WORKLOAD_JSONPATH = (
+    '{range .items[*]}'
+    '{.kind}{"\\t"}{.metadata.namespace}{"\\t"}{.spec.template.spec.containers[*].image}{"\\t"}'
+    '{.metadata.labels}{"\\t"}{.metadata.name}{"\\n"}'
+    '{end}'
+)
+
+_VERSION_RE = re.compile(r'[\d.]+')
+_KUBELET_RE = re.compile(r'v[\d.]+')
+# Node ranges as written by cmsh, e.g. "node001..node007"
+_NODE_RANGE_RE = re.compile(r'(\w+?)(\d+)\.\.(\w+?)(\d+)')
+
+
+# With --cache, collected data is cached on disk for a short time so
+# back-to-back runs do not query the cluster again. It is off by default so
+# --pre/--post snapshots always reflect the cluster as it is now.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'k8s-overview')
+USE_CACHE = False
+
+
+@functools.lru_cache(maxsize=1)
+def cluster_cache_key() -> str:
+    """
+    Identify the cluster being queried (kubeconfig, current context and API
+    server) so cached data is never reused for another cluster.
+    """
+    stdout, _, _ = run_command(
+        ['kubectl', 'config', 'view', '--minify',
+         '-o', 'jsonpath={.current-context}{"\\t"}{.clusters[0].cluster.server}']
+    )
+    identity = f"{os.environ.get('KUBECONFIG', '')}\t{stdout}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def cached(ttl: int):
+    """
+    Decorator caching a collector's result in
+    CACHE_DIR/<function name>-<cluster key>.json for ttl seconds while
+    USE_CACHE is set. Empty and N/A results are not cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not USE_CACHE:
+                return func(*args, **kwargs)
+            
+            cache_file = os.path.join(CACHE_DIR, f"{func.__name__}-{cluster_cache_key()}.json")
+            try:
+                if time.time() - os.path.getmtime(cache_file) < ttl:
+                    with open(cache_file, 'r') as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
+            
+            result = func(*args, **kwargs)
+            
+            if result and result != 'N/A':
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(cache_file, 'w') as f:
+                        json.dump(result, f)
+                except OSError:
+                    pass
+            return result
+        return wrapper
+    return decorator
+
+
+# The collectors run on worker threads in collect_data(); their messages are
+# held per thread and printed under the matching progress step there instead
+# of interleaving with it
+_log_buffer = threading.local()
+
+
+def log(message: str):
+    """Print a collector message, or hold it while running under collect_output()."""
+    lines = getattr(_log_buffer, 'lines', None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+def collect_output(collector) -> Tuple[object, List[str]]:
+    """Run a collector and return its result with the messages it logged."""
+    _log_buffer.lines = []
+    try:
+        return collector(), _log_buffer.lines
+    finally:
+        _log_buffer.lines = None
+
+
+def run_command(cmd: Union[str, List[str]], shell: bool = False, check: bool = False,
+                text: bool = True) -> Tuple[Union[str, bytes], str, int]:
     """
-    Run a shell command and return stdout, stderr, and return code.
+    Run a command and return stdout, stderr, and return code.
+    A string command is split into arguments with shlex unless shell=True.
+    With text=False stdout is returned as bytes, e.g. to hand straight to json_loads().
     """
+    if isinstance(cmd, str) and not shell:
+        cmd = shlex.split(cmd)
+    
     try:
         result = subprocess.run(
             cmd,
             shell=shell,
             capture_output=True,
-            text=True,
+            text=text,
             check=check
         )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
+        stdout, stderr = result.stdout, result.stderr
+        rc = result.returncode
     except subprocess.CalledProcessError as e:
-        return e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else "", e.returncode
+        stdout, stderr, rc = e.stdout, e.stderr, e.returncode
     except Exception as e:
-        return "", str(e), 1
+        return "" if text else b"", str(e), 1
+    
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors='replace')
+    return (stdout or ("" if text else b"")).strip(), (stderr or "").strip(), rc
 
 
+@cached(ttl=10)
 def get_helm_releases() -> Dict[str, Dict[str, str]]:
     """
     Get all Helm releases with their chart version and app version.
@@ -42,14 +160,16 @@ def get_helm_releases() -> Dict[str, Dict[str, str]]:
     helm_releases = {}
     
     # Get list of all Helm releases across all namespaces
-    stdout, stderr, rc = run_command("helm list --all-namespaces -o json")
+    stdout, stderr, rc = run_command("helm list --all-namespaces -o json", text=False)
     
     if rc != 0 or not stdout:
-        print(f"Warning: Could not get Helm releases: {stderr}")
+        log(f"Warning: Could not get Helm releases: {stderr}")
         return helm_releases
     
     try:
-        releases = json.loads(stdout)
+        releases = json_loads(stdout)
+        # Release the raw output before building the result from the parsed list
+        del stdout
         for release in releases:
             name = release.get('name', '')
             namespace = release.get('namespace', '')
@@ -72,157 +192,185 @@ def get_helm_releases() -> Dict[str, Dict[str, str]]:
                 'app_version': app_version
             }
     except json.JSONDecodeError as e:
-        print(f"Warning: Could not parse Helm output: {e}")
+        log(f"Warning: Could not parse Helm output: {e}")
     
     return helm_releases
 
 
+def workload_from_line(line: str) -> Optional[Dict[str, any]]:
+    """
+    Build a workload entry from one line of WORKLOAD_JSONPATH output.
+    Returns None if the workload has no container images.
+    """
+    kind, namespace, images, labels, name = line.split('\t')
+    images = images.split()
+    
+    if not images:
+        return None
+    
+    return {
+        'type': kind,
+        'namespace': namespace,
+        'name': name,
+        'images': images,
+        'image_versions': [extract_version_from_image(image) for image in images],
+        'labels': json_loads(labels) if labels else {}
+    }
+
+
+def get_image_versions(workload_data: Dict) -> List[str]:
+    """
+    Return the image versions of a workload.
+    Snapshots saved before image_versions was stored are derived from the images.
+    """
+    if 'image_versions' in workload_data:
+        return workload_data['image_versions']
+    return [extract_version_from_image(img) for img in workload_data.get('images', [])]
+
+
+@cached(ttl=10)
 def get_k8s_workloads() -> Dict[str, Dict[str, any]]:
     """
     Get all Kubernetes workloads (Deployments, StatefulSets, DaemonSets) with their images.
-    Returns: {namespace/name: {type, namespace, name, images}}
+    Returns: {namespace/name: {type, namespace, name, images, image_versions, labels}}
     """
     workloads = {}
     
-    # Resource types to check
-    resource_types = ['deployments', 'statefulsets', 'daemonsets']
+    # One kubectl call lists every workload kind, projected down to the
+    # fields we keep instead of the full objects
+    stdout, stderr, rc = run_command(
+        "kubectl get deployments,statefulsets,daemonsets --all-namespaces "
+        f"-o jsonpath={shlex.quote(WORKLOAD_JSONPATH)}"
+    )
     
-    for resource_type in resource_types:
-        stdout, stderr, rc = run_command(
-            f"kubectl get {resource_type} --all-namespaces -o json"
-        )
-        
-        if rc != 0:
-            print(f"Warning: Could not get {resource_type}: {stderr}")
-            continue
-        
-        try:
-            data = json.loads(stdout)
-            items = data.get('items', [])
-            
-            for item in items:
-                metadata = item.get('metadata', {})
-                name = metadata.get('name', '')
-                namespace = metadata.get('namespace', '')
-                labels = metadata.get('labels', {})
-                
-                # Extract images from containers
-                spec = item.get('spec', {})
-                template = spec.get('template', {})
-                pod_spec = template.get('spec', {})
-                containers = pod_spec.get('containers', [])
-                
-                images = []
-                for container in containers:
-                    image = container.get('image', '')
-                    if image:
-                        images.append(image)
-                
-                if images:
-                    key = f"{namespace}/{name}"
-                    workloads[key] = {
-                        'type': resource_type.rstrip('s').capitalize(),
-                        'namespace': namespace,
-                        'name': name,
-                        'images': images,
-                        'labels': labels
-                    }
-        except json.JSONDecodeError as e:
-            print(f"Warning: Could not parse {resource_type} output: {e}")
+    if rc != 0:
+        log(f"Warning: Could not get workloads: {stderr}")
+        return workloads
+    
+    # Only the split lines are needed from here on, so drop the raw output
+    lines = stdout.splitlines()
+    del stdout
+    
+    try:
+        for line in lines:
+            workload = workload_from_line(line)
+            if workload:
+                workloads[f"{workload['namespace']}/{workload['name']}"] = workload
+    except ValueError as e:
+        log(f"Warning: Could not parse workloads output: {e}")
     
     return workloads
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_version_from_image(image: str) -> str:
     """
     Extract version from a container image string.
     Example: "nginx:1.21.0" -> "1.21.0"
+    Results are cached since the same image appears across many workloads.
     """
     # Handle image format: [registry/]repository[:tag][@digest]
-    if '@' in image:
-        # Remove digest part
-        image = image.split('@')[0]
+    # Drop the digest part, then take whatever follows the last ':'
+    _, sep, version = image.partition('@')[0].rpartition(':')
     
-    if ':' in image:
-        version = image.split(':')[-1]
-        # Filter out 'latest' as it's not informative
-        if version.lower() != 'latest':
-            return version
+    # Filter out 'latest' as it's not informative
+    if sep and version.lower() != 'latest':
+        return version
     
     return 'latest'
 
 
-def is_helm_managed(workload_key: str, workload_data: Dict, helm_releases: Dict) -> Optional[str]:
+def build_helm_index(helm_releases: Dict) -> Dict[str, Dict[str, str]]:
+    """
+    Index Helm releases by namespace for is_helm_managed().
+    Returns: {namespace: {release_name: helm_key}} with the longest names first
+    """
+    helm_index = {}
+    for helm_key, helm_data in sorted(helm_releases.items(), key=lambda item: len(item[1]['name']), reverse=True):
+        helm_index.setdefault(helm_data['namespace'], {})[helm_data['name']] = helm_key
+    return helm_index
+
+
+def is_helm_managed(workload_key: str, workload_data: Dict, helm_index: Dict) -> Optional[str]:
     """
     Check if a workload is managed by Helm.
+    helm_index is the namespace index returned by build_helm_index().
     Returns the Helm release key if managed, None otherwise.
     """
     namespace = workload_data['namespace']
     labels = workload_data.get('labels', {})
+    releases = helm_index.get(namespace, {})
     
     # Check for Helm labels
     helm_release_name = labels.get('app.kubernetes.io/managed-by')
     if helm_release_name and helm_release_name.lower() == 'helm':
         # Try to find the release name
         release_name = labels.get('app.kubernetes.io/instance') or labels.get('release')
-        if release_name:
-            helm_key = f"{namespace}/{release_name}"
-            if helm_key in helm_releases:
-                return helm_key
+        if release_name in releases:
+            return releases[release_name]
     
-    # Fallback: check if workload name matches any Helm release name
-    for helm_key, helm_data in helm_releases.items():
-        if helm_data['namespace'] == namespace:
-            # Check if workload name starts with release name
-            if workload_data['name'].startswith(helm_data['name']):
-                return helm_key
+    # Fallback: check if workload name starts with a release name in its namespace
+    workload_name = workload_data['name']
+    for name, helm_key in releases.items():
+        if workload_name.startswith(name):
+            return helm_key
     
     return None
 
 
+@cached(ttl=60)
 def get_kubernetes_component_versions() -> Dict[str, str]:
     """
     Get versions of Kubernetes components.
     """
     versions = {}
     
-    # Get kubectl version
-    stdout, stderr, rc = run_command("kubectl version --client=true -o json")
-    if rc == 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            client_version = data.get('clientVersion', {})
-            git_version = client_version.get('gitVersion', 'N/A')
-            versions['kubectl'] = git_version
-        except:
-            pass
+    # The version commands are independent, so run them all at once
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        kubectl_future = executor.submit(run_command, "kubectl version -o json", text=False)
+        kubeadm_future = executor.submit(run_command, "kubeadm version -o short")
+        kubelet_future = executor.submit(run_command, "kubelet --version")
+        containerd_future = executor.submit(run_command, "containerd --version")
+        docker_future = executor.submit(run_command, "docker --version")
     
-    # Get Kubernetes server version
-    stdout, stderr, rc = run_command("kubectl version -o json")
-    if rc == 0 and stdout:
+    # Get kubectl client and Kubernetes server versions from a single call;
+    # the output still carries clientVersion when the server is unreachable
+    stdout, stderr, rc = kubectl_future.result()
+    data = {}
+    if stdout:
         try:
-            data = json.loads(stdout)
-            server_version = data.get('serverVersion', {})
-            git_version = server_version.get('gitVersion', 'N/A')
-            versions['kubernetes-server'] = git_version
+            data = json_loads(stdout)
         except:
             pass
     
+    if 'clientVersion' not in data:
+        stdout, stderr, rc = run_command("kubectl version --client=true -o json", text=False)
+        if rc == 0 and stdout:
+            try:
+                data = json_loads(stdout)
+            except:
+                pass
+    
+    if 'clientVersion' in data:
+        versions['kubectl'] = data['clientVersion'].get('gitVersion', 'N/A')
+    if 'serverVersion' in data:
+        versions['kubernetes-server'] = data['serverVersion'].get('gitVersion', 'N/A')
+    
     # Get kubeadm version
-    stdout, stderr, rc = run_command("kubeadm version -o short")
+    stdout, stderr, rc = kubeadm_future.result()
     if rc == 0 and stdout:
         versions['kubeadm'] = stdout
     
     # Get kubelet version
-    stdout, stderr, rc = run_command("kubelet --version")
+    stdout, stderr, rc = kubelet_future.result()
     if rc == 0 and stdout:
         # Output format: "Kubernetes v1.x.x"
-        match = re.search(r'v[\d.]+', stdout)
+        match = _KUBELET_RE.search(stdout)
         if match:
             versions['kubelet'] = match.group(0)
     
     # Get containerd version
-    stdout, stderr, rc = run_command("containerd --version")
+    stdout, stderr, rc = containerd_future.result()
     if rc == 0 and stdout:
         # Output format: "containerd containerd.io 1.x.x ..."
         parts = stdout.split()
@@ -230,38 +378,32 @@ def get_kubernetes_component_versions() -> Dict[str, str]:
             versions['containerd'] = parts[2]
     
     # Try to get docker version if available
-    stdout, stderr, rc = run_command("docker --version")
+    stdout, stderr, rc = docker_future.result()
     if rc == 0 and stdout:
-        match = re.search(r'[\d.]+', stdout)
+        match = _VERSION_RE.search(stdout)
         if match:
             versions['docker'] = match.group(0)
     
-    # Get CNI version if possible
-    stdout, stderr, rc = run_command("kubectl get pods -n kube-system -o json")
-    if rc == 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            items = data.get('items', [])
-            for item in items:
-                name = item.get('metadata', {}).get('name', '')
-                if 'calico' in name.lower():
-                    containers = item.get('spec', {}).get('containers', [])
-                    for container in containers:
-                        image = container.get('image', '')
-                        if 'calico' in image:
-                            version = extract_version_from_image(image)
-                            versions['calico-cni'] = version
-                            break
-                elif 'flannel' in name.lower():
-                    containers = item.get('spec', {}).get('containers', [])
-                    for container in containers:
-                        image = container.get('image', '')
-                        if 'flannel' in image:
-                            version = extract_version_from_image(image)
-                            versions['flannel-cni'] = version
-                            break
-        except:
-            pass
+    return versions
+
+
+def get_cni_versions(workloads: Dict[str, Dict[str, any]]) -> Dict[str, str]:
+    """
+    Get the CNI version from the kube-system workloads returned by get_k8s_workloads().
+    """
+    versions = {}
+    
+    for workload_data in workloads.values():
+        if workload_data['namespace'] != 'kube-system':
+            continue
+        name = workload_data['name'].lower()
+        for cni in ('calico', 'flannel'):
+            if cni in name:
+                for image in workload_data.get('images', []):
+                    if cni in image:
+                        versions[f'{cni}-cni'] = extract_version_from_image(image)
+                        break
+                break
     
     return versions
 
@@ -276,7 +418,7 @@ def get_etcd_nodes() -> List[str]:
     stdout, stderr, rc = run_command('cmsh -c "configurationoverlay;list"')
     
     if rc != 0:
-        print(f"Warning: Could not get configuration overlay list: {stderr}")
+        log(f"Warning: Could not get configuration overlay list: {stderr}")
         return etcd_nodes
     
     # Parse the output to find the Etcd::Host role
@@ -289,7 +431,7 @@ def get_etcd_nodes() -> List[str]:
             break
     
     if not etcd_line:
-        print("Warning: Could not find Etcd::Host role in configuration overlay")
+        log("Warning: Could not find Etcd::Host role in configuration overlay")
         return etcd_nodes
     
     # Parse the line to extract nodes
@@ -301,7 +443,7 @@ def get_etcd_nodes() -> List[str]:
     try:
         etcd_index = parts.index('Etcd::Host')
     except ValueError:
-        print("Warning: Could not parse Etcd::Host line")
+        log("Warning: Could not parse Etcd::Host line")
         return etcd_nodes
     
     # The nodes should be before the roles section
@@ -314,15 +456,13 @@ def get_etcd_nodes() -> List[str]:
         # Handle node ranges like "node001..node007" or single nodes like "node001"
         if '..' in nodes_field:
             # Parse node range
-            match = re.match(r'(\w+?)(\d+)\.\.(\w+?)(\d+)', nodes_field)
+            match = _NODE_RANGE_RE.match(nodes_field)
             if match:
                 prefix1, start, prefix2, end = match.groups()
                 if prefix1 == prefix2:
-                    start_num = int(start)
-                    end_num = int(end)
-                    for i in range(start_num, end_num + 1):
-                        node_name = f"{prefix1}{i:0{len(start)}d}"
-                        etcd_nodes.append(node_name)
+                    # Zero-pad to the width used in the range, e.g. node001
+                    node_name = f"{prefix1}{{:0{len(start)}d}}".format
+                    etcd_nodes.extend(node_name(i) for i in range(int(start), int(end) + 1))
             else:
                 # Couldn't parse range, add as-is
                 etcd_nodes.append(nodes_field)
@@ -344,20 +484,27 @@ def get_etcd_nodes() -> List[str]:
             # Split by comma if there are multiple categories
             categories = [c.strip() for c in categories_str.split(',') if c.strip()]
             
+            # List devices once and group them by category in a single pass
+            # rather than calling cmsh per category
+            stdout, stderr, rc = run_command('cmsh -c "device list"')
+            category_set = set(categories)
+            nodes_by_category = {category: [] for category in categories}
+            
+            for line in (stdout.split('\n') if rc == 0 else []):
+                fields = line.split()
+                for field in category_set.intersection(fields):
+                    # Extract node name (typically first field)
+                    nodes_by_category[field].append(fields[0])
+            
             for category in categories:
-                stdout, stderr, rc = run_command(f'cmsh -c "device list" | grep {category}')
-                if rc == 0 and stdout:
-                    # Parse device list output
-                    for line in stdout.split('\n'):
-                        if line.strip():
-                            # Extract node name (typically first field)
-                            node_name = line.split()[0]
-                            if node_name and node_name not in etcd_nodes:
-                                etcd_nodes.append(node_name)
+                for node_name in nodes_by_category[category]:
+                    if node_name not in etcd_nodes:
+                        etcd_nodes.append(node_name)
     
     return etcd_nodes
 
 
+@cached(ttl=300)
 def get_etcd_version() -> str:
     """
     Get etcd version by SSHing to an etcd node.
@@ -365,30 +512,37 @@ def get_etcd_version() -> str:
     etcd_nodes = get_etcd_nodes()
     
     if not etcd_nodes:
-        print("Warning: No etcd nodes found")
+        log("Warning: No etcd nodes found")
         return "N/A"
     
-    # Try the first etcd node
-    node = etcd_nodes[0]
-    print(f"Checking etcd version on node: {node}")
-    
-    stdout, stderr, rc = run_command(
-        f'ssh -o StrictHostKeyChecking=no {node} "/cm/local/apps/etcd/current/bin/etcd --version"'
-    )
+    # etcd is replicated, so any node can answer: ask all of them at once and
+    # take the first version reported. Both binary locations are tried remotely.
+    log(f"Checking etcd version on nodes: {', '.join(etcd_nodes)}")
+    remote_cmd = "/cm/local/apps/etcd/current/bin/etcd --version || etcd --version"
     
-    if rc != 0:
-        print(f"Warning: Could not get etcd version from {node}: {stderr}")
-        # Try alternative path
-        stdout, stderr, rc = run_command(
-            f'ssh -o StrictHostKeyChecking=no {node} "etcd --version"'
+    def query(node):
+        return run_command(
+            f'ssh -o StrictHostKeyChecking=no -o ConnectTimeout=3 -o BatchMode=yes {node} "{remote_cmd}"'
         )
     
-    if rc == 0 and stdout:
-        # Parse etcd version output
-        # Format: "etcd Version: 3.x.x" or similar
-        match = re.search(r'[\d.]+', stdout)
-        if match:
-            return match.group(0)
+    executor = ThreadPoolExecutor(max_workers=min(len(etcd_nodes), 16))
+    futures = {executor.submit(query, node): node for node in etcd_nodes}
+    try:
+        for future in as_completed(futures):
+            node = futures[future]
+            stdout, stderr, rc = future.result()
+            
+            if rc == 0 and stdout:
+                # Parse etcd version output
+                # Format: "etcd Version: 3.x.x" or similar
+                match = _VERSION_RE.search(stdout)
+                if match:
+                    return match.group(0)
+            
+            log(f"Warning: Could not get etcd version from {node}: {stderr}")
+    finally:
+        # Don't wait for slower nodes once a version is known
+        executor.shutdown(wait=False)
     
     return "N/A"
 
@@ -397,21 +551,37 @@ def collect_data() -> Dict:
     """
     Collect all version data.
     """
-    print("\n1. Collecting Helm releases...")
-    helm_releases = get_helm_releases()
-    print(f"   Found {len(helm_releases)} Helm releases")
-    
-    print("\n2. Collecting Kubernetes workloads...")
-    workloads = get_k8s_workloads()
-    print(f"   Found {len(workloads)} workloads")
-    
-    print("\n3. Collecting Kubernetes component versions...")
-    k8s_versions = get_kubernetes_component_versions()
-    print(f"   Found {len(k8s_versions)} component versions")
-    
-    print("\n4. Collecting etcd version...")
-    etcd_version = get_etcd_version()
-    print(f"   etcd version: {etcd_version}")
+    # The collectors are independent and I/O-bound, so run them concurrently
+    # and report on each in order as its result becomes available; the CNI
+    # version is then read from the collected workloads
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        helm_future = executor.submit(collect_output, get_helm_releases)
+        workloads_future = executor.submit(collect_output, get_k8s_workloads)
+        k8s_versions_future = executor.submit(collect_output, get_kubernetes_component_versions)
+        etcd_future = executor.submit(collect_output, get_etcd_version)
+        
+        def result_of(future):
+            result, messages = future.result()
+            for message in messages:
+                print(message)
+            return result
+        
+        print("\n1. Collecting Helm releases...")
+        helm_releases = result_of(helm_future)
+        print(f"   Found {len(helm_releases)} Helm releases")
+        
+        print("\n2. Collecting Kubernetes workloads...")
+        workloads = result_of(workloads_future)
+        print(f"   Found {len(workloads)} workloads")
+        
+        print("\n3. Collecting Kubernetes component versions...")
+        k8s_versions = result_of(k8s_versions_future)
+        k8s_versions.update(get_cni_versions(workloads))
+        print(f"   Found {len(k8s_versions)} component versions")
+        
+        print("\n4. Collecting etcd version...")
+        etcd_version = result_of(etcd_future)
+        print(f"   etcd version: {etcd_version}")
     
     return {
         'helm_releases': helm_releases,
@@ -422,6 +592,22 @@ def collect_data() -> Dict:
     }
 
 
+# An application row of the diff report. version is the text shown in the
+# report (chart and app version for Helm, image versions otherwise) and is
+# also what pre and post are compared on.
+AppRec = namedtuple('AppRec', 'namespace name source version')
+
+
+def ensure_parent_dir(path: str):
+    """
+    Create the directory a file will be written to, if it has one.
+    A bare filename has no directory part and is written to the current directory.
+    """
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
 def generate_markdown_report(data: Dict, output_file: str, title: str):
     """
     Generate a markdown report with all version information.
@@ -431,100 +617,63 @@ def generate_markdown_report(data: Dict, output_file: str, title: str):
     k8s_versions = data['k8s_versions']
     etcd_version = data['etcd_version']
     
-    # Create output directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    out = []
+    out.append(f"# {title}\n\n")
+    out.append("This document contains version information for Kubernetes components and applications.\n\n")
+    out.append(f"**Generated:** {data.get('timestamp', 'N/A')}\n\n")
     
-    with open(output_file, 'w') as f:
-        f.write(f"# {title}\n\n")
-        f.write("This document contains version information for Kubernetes components and applications.\n\n")
-        f.write(f"**Generated:** {data.get('timestamp', 'N/A')}\n\n")
-        
-        # Kubernetes Components Section
-        f.write("## Kubernetes Components\n\n")
-        f.write("| Component | Version |\n")
-        f.write("|-----------|----------|\n")
-        
-        # Add etcd first
-        f.write(f"| etcd | {etcd_version} |\n")
-        
-        # Add other components
-        for component, version in sorted(k8s_versions.items()):
-            f.write(f"| {component} | {version} |\n")
-        
-        f.write("\n")
-        
-        # Applications Section
-        f.write("## Applications\n\n")
-        
-        # Combine Helm releases and non-Helm workloads
-        all_apps = {}
-        helm_managed_workloads = set()
-        
-        # Add Helm releases
-        for helm_key, helm_data in helm_releases.items():
-            app_name = f"{helm_data['namespace']}/{helm_data['name']}"
-            all_apps[app_name] = {
-                'namespace': helm_data['namespace'],
-                'name': helm_data['name'],
-                'source': 'Helm',
-                'chart_version': helm_data['chart_version'],
-                'app_version': helm_data['app_version'],
-                'images': []
-            }
-        
-        # Add non-Helm workloads
-        for workload_key, workload_data in workloads.items():
-            helm_key = is_helm_managed(workload_key, workload_data, helm_releases)
-            
-            if helm_key:
-                # This workload is managed by Helm, skip it
-                helm_managed_workloads.add(workload_key)
-            else:
-                # This is a standalone workload
-                app_name = workload_key
-                images = workload_data.get('images', [])
-                image_versions = [extract_version_from_image(img) for img in images]
-                
-                all_apps[app_name] = {
-                    'namespace': workload_data['namespace'],
-                    'name': workload_data['name'],
-                    'source': 'Kubernetes',
-                    'type': workload_data['type'],
-                    'images': images,
-                    'image_versions': image_versions
-                }
-        
-        # Write applications table
-        f.write("| Namespace | Application | Source | Chart Version | App Version | Image Version(s) |\n")
-        f.write("|-----------|-------------|--------|---------------|-------------|------------------|\n")
-        
-        for app_key in sorted(all_apps.keys()):
-            app = all_apps[app_key]
-            namespace = app['namespace']
-            name = app['name']
-            source = app['source']
-            
-            if source == 'Helm':
-                chart_version = app['chart_version']
-                app_version = app['app_version']
-                image_versions = '-'
-            else:
-                chart_version = '-'
-                app_version = '-'
-                image_versions = ', '.join(app.get('image_versions', []))
-                if not image_versions:
-                    image_versions = '-'
-            
-            f.write(f"| {namespace} | {name} | {source} | {chart_version} | {app_version} | {image_versions} |\n")
-        
-        f.write("\n")
-        
-        # Summary
-        f.write("## Summary\n\n")
-        f.write(f"- **Total Kubernetes Components**: {len(k8s_versions) + 1}\n")  # +1 for etcd
-        f.write(f"- **Total Helm Releases**: {len(helm_releases)}\n")
-        f.write(f"- **Total Kubernetes Workloads (non-Helm)**: {len(all_apps) - len(helm_releases)}\n")
-        f.write(f"- **Total Applications**: {len(all_apps)}\n")
+    # Kubernetes Components Section
+    out.append("## Kubernetes Components\n\n")
+    out.append("| Component | Version |\n")
+    out.append("|-----------|----------|\n")
+    
+    # Add etcd first
+    out.append(f"| etcd | {etcd_version} |\n")
+    
+    # Add other components
+    for component, version in sorted(k8s_versions.items()):
+        out.append(f"| {component} | {version} |\n")
+    
+    out.append("\n")
+    
+    # Applications Section
+    out.append("## Applications\n\n")
+    
+    # One table row per namespace/name; a standalone workload takes the place
+    # of a Helm release with the same key
+    app_rows = {
+        f"{helm_data['namespace']}/{helm_data['name']}":
+            f"| {helm_data['namespace']} | {helm_data['name']} | Helm | "
+            f"{helm_data['chart_version']} | {helm_data['app_version']} | - |\n"
+        for helm_data in helm_releases.values()
+    }
+    
+    helm_index = build_helm_index(helm_releases)
+    for workload_key, workload_data in workloads.items():
+        if not is_helm_managed(workload_key, workload_data, helm_index):
+            app_rows[workload_key] = (
+                f"| {workload_data['namespace']} | {workload_data['name']} | Kubernetes | - | - | "
+                f"{', '.join(get_image_versions(workload_data)) or '-'} |\n"
+            )
+    total_apps = len(app_rows)
+    
+    # Write applications table
+    out.append("| Namespace | Application | Source | Chart Version | App Version | Image Version(s) |\n")
+    out.append("|-----------|-------------|--------|---------------|-------------|------------------|\n")
+    out.extend(app_rows[app_key] for app_key in sorted(app_rows))
+    
+    out.append("\n")
+    
+    # Summary
+    out.append("## Summary\n\n")
+    out.append(f"- **Total Kubernetes Components**: {len(k8s_versions) + 1}\n")  # +1 for etcd
+    out.append(f"- **Total Helm Releases**: {len(helm_releases)}\n")
+    out.append(f"- **Total Kubernetes Workloads (non-Helm)**: {total_apps - len(helm_releases)}\n")
+    out.append(f"- **Total Applications**: {total_apps}\n")
+    
+    ensure_parent_dir(output_file)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(out))
     
     print(f"\nReport generated: {output_file}")
 
@@ -533,13 +682,12 @@ def load_data_from_file(filename: str) -> Optional[Dict]:
     """
     Load previously collected data from a JSON file.
     """
-    if not os.path.exists(filename):
-        return None
-    
     try:
         with open(filename, 'r') as f:
             return json.load(f)
-    except Exception as e:
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
         print(f"Error loading data from {filename}: {e}")
         return None
 
@@ -548,7 +696,7 @@ def save_data_to_file(data: Dict, filename: str):
     """
     Save collected data to a JSON file.
     """
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    ensure_parent_dir(filename)
     with open(filename, 'w') as f:
         json.dump(data, f, indent=2)
     print(f"Data saved to: {filename}")
@@ -559,8 +707,6 @@ def generate_simplified_summary(pre_data: Dict, post_data: Dict, output_file: st
     Generate a simplified summary report for easy copy-paste to emails.
     Consolidates multiple components into single application rows.
     """
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
     # Helper function to consolidate apps by namespace/helm release
     def consolidate_apps(data):
         """Consolidate workloads into main applications (Helm releases or namespace groups)"""
@@ -582,16 +728,13 @@ def generate_simplified_summary(pre_data: Dict, post_data: Dict, output_file: st
             }
         
         # Add standalone workloads (not managed by Helm)
+        helm_index = build_helm_index(helm_releases)
         for workload_key, workload_data in workloads.items():
-            helm_key = is_helm_managed(workload_key, workload_data, helm_releases)
+            helm_key = is_helm_managed(workload_key, workload_data, helm_index)
             if not helm_key:
                 namespace = workload_data['namespace']
                 name = workload_data['name']
                 
-                # Check if this is part of a known multi-component system
-                # Group by namespace for certain known systems
-                parent_key = None
-                
                 # Don't create duplicate entries for workloads that are clearly sub-components
                 # These namespaces typically have ONE main component, skip individual workloads
                 skip_namespaces = {'runai', 'runai-backend', 'gpu-operator', 'network-operator', 'prometheus'}
@@ -601,15 +744,12 @@ def generate_simplified_summary(pre_data: Dict, post_data: Dict, output_file: st
                     continue
                 
                 # For user workload namespaces or standalone apps, add them
-                images = workload_data.get('images', [])
-                image_versions = [extract_version_from_image(img) for img in images]
-                
                 key = f"{namespace}/{name}"
                 consolidated[key] = {
                     'namespace': namespace,
                     'name': name,
                     'source': 'Kubernetes',
-                    'image_versions': ', '.join(image_versions) if image_versions else 'N/A',
+                    'image_versions': ', '.join(get_image_versions(workload_data)) or 'N/A',
                     'is_helm': False
                 }
         
@@ -617,310 +757,271 @@ def generate_simplified_summary(pre_data: Dict, post_data: Dict, output_file: st
     
     pre_apps = consolidate_apps(pre_data)
     post_apps = consolidate_apps(post_data)
-    all_apps = set(pre_apps.keys()) | set(post_apps.keys())
+    all_apps = pre_apps.keys() | post_apps.keys()
     
-    with open(output_file, 'w') as f:
-        f.write("# Upgrade Summary (Simplified)\n\n")
-        f.write("This summary consolidates components for easy copy-paste to emails.\n\n")
-        f.write(f"**Pre-upgrade:** {pre_data.get('timestamp', 'N/A')}\n\n")
-        f.write(f"**Post-upgrade:** {post_data.get('timestamp', 'N/A')}\n\n")
-        
-        # Kubernetes Components
-        f.write("## Kubernetes Components\n\n")
-        f.write("| Component | Pre-Upgrade | Post-Upgrade | Status |\n")
-        f.write("|-----------|-------------|--------------|--------|\n")
-        
-        pre_k8s = pre_data['k8s_versions']
-        post_k8s = post_data['k8s_versions']
-        pre_etcd = pre_data['etcd_version']
-        post_etcd = post_data['etcd_version']
-        
-        # etcd
-        if pre_etcd != post_etcd:
-            f.write(f"| etcd | {pre_etcd} | {post_etcd} | ✅ Upgraded |\n")
+    out = []
+    out.append("# Upgrade Summary (Simplified)\n\n")
+    out.append("This summary consolidates components for easy copy-paste to emails.\n\n")
+    out.append(f"**Pre-upgrade:** {pre_data.get('timestamp', 'N/A')}\n\n")
+    out.append(f"**Post-upgrade:** {post_data.get('timestamp', 'N/A')}\n\n")
+    
+    # Kubernetes Components
+    out.append("## Kubernetes Components\n\n")
+    out.append("| Component | Pre-Upgrade | Post-Upgrade | Status |\n")
+    out.append("|-----------|-------------|--------------|--------|\n")
+    
+    pre_k8s = pre_data['k8s_versions']
+    post_k8s = post_data['k8s_versions']
+    pre_etcd = pre_data['etcd_version']
+    post_etcd = post_data['etcd_version']
+    
+    # Count component changes while the rows are written
+    k8s_changed = 0
+    
+    # etcd
+    if pre_etcd != post_etcd:
+        out.append(f"| etcd | {pre_etcd} | {post_etcd} | ✅ Upgraded |\n")
+        k8s_changed += 1
+    else:
+        out.append(f"| etcd | {pre_etcd} | {post_etcd} | No change |\n")
+    
+    # Other K8s components
+    all_components = pre_k8s.keys() | post_k8s.keys()
+    for component in sorted(all_components):
+        pre_ver = pre_k8s.get(component, 'N/A')
+        post_ver = post_k8s.get(component, 'N/A')
+        
+        if pre_ver == post_ver:
+            status = "No change"
         else:
-            f.write(f"| etcd | {pre_etcd} | {post_etcd} | No change |\n")
-        
-        # Other K8s components
-        all_components = set(pre_k8s.keys()) | set(post_k8s.keys())
-        for component in sorted(all_components):
-            pre_ver = pre_k8s.get(component, 'N/A')
-            post_ver = post_k8s.get(component, 'N/A')
-            
-            if pre_ver == 'N/A' and post_ver != 'N/A':
+            k8s_changed += 1
+            if pre_ver == 'N/A':
                 status = "🆕 Added"
-            elif pre_ver != 'N/A' and post_ver == 'N/A':
+            elif post_ver == 'N/A':
                 status = "❌ Removed"
-            elif pre_ver != post_ver:
-                status = "✅ Upgraded"
             else:
-                status = "No change"
-            
-            f.write(f"| {component} | {pre_ver} | {post_ver} | {status} |\n")
-        
-        f.write("\n")
-        
-        # Applications (consolidated)
-        f.write("## Applications\n\n")
-        f.write("| Namespace | Application | Pre-Upgrade | Post-Upgrade | Status |\n")
-        f.write("|-----------|-------------|-------------|--------------|--------|\n")
-        
-        # Count changes for summary
-        k8s_changed = 0
-        apps_upgraded = 0
-        apps_added = 0
-        apps_removed = 0
-        apps_unchanged = 0
-        
-        # K8s component changes
-        components_changed = sum(1 for c in all_components if pre_k8s.get(c) != post_k8s.get(c))
-        if pre_etcd != post_etcd:
-            components_changed += 1
-        k8s_changed = components_changed
+                status = "✅ Upgraded"
         
-        # Process apps
-        for app_key in sorted(all_apps):
-            pre_app = pre_apps.get(app_key)
-            post_app = post_apps.get(app_key)
+        out.append(f"| {component} | {pre_ver} | {post_ver} | {status} |\n")
+    
+    out.append("\n")
+    
+    # Applications (consolidated)
+    out.append("## Applications\n\n")
+    out.append("| Namespace | Application | Pre-Upgrade | Post-Upgrade | Status |\n")
+    out.append("|-----------|-------------|-------------|--------------|--------|\n")
+    
+    # Count changes for summary
+    apps_upgraded = 0
+    apps_added = 0
+    apps_removed = 0
+    apps_unchanged = 0
+    
+    # Process apps
+    for app_key in sorted(all_apps):
+        pre_app = pre_apps.get(app_key)
+        post_app = post_apps.get(app_key)
+        
+        if pre_app and post_app:
+            namespace = pre_app['namespace']
+            name = pre_app['name']
             
-            if pre_app and post_app:
-                namespace = pre_app['namespace']
-                name = pre_app['name']
+            if pre_app.get('is_helm'):
+                pre_ver = pre_app['chart_version']
+                post_ver = post_app['chart_version']
                 
-                if pre_app.get('is_helm'):
-                    pre_ver = pre_app['chart_version']
-                    post_ver = post_app['chart_version']
-                    
-                    if pre_app['chart_version'] != post_app['chart_version']:
-                        status = "✅ Upgraded"
-                        apps_upgraded += 1
-                    else:
-                        status = "No change"
-                        apps_unchanged += 1
+                if pre_app['chart_version'] != post_app['chart_version']:
+                    status = "✅ Upgraded"
+                    apps_upgraded += 1
                 else:
-                    pre_ver = pre_app.get('image_versions', 'N/A')
-                    post_ver = post_app.get('image_versions', 'N/A')
-                    
-                    if pre_ver != post_ver:
-                        status = "✅ Upgraded"
-                        apps_upgraded += 1
-                    else:
-                        status = "No change"
-                        apps_unchanged += 1
-                
-                f.write(f"| {namespace} | {name} | {pre_ver} | {post_ver} | {status} |\n")
-            
-            elif pre_app and not post_app:
-                namespace = pre_app['namespace']
-                name = pre_app['name']
+                    status = "No change"
+                    apps_unchanged += 1
+            else:
+                pre_ver = pre_app.get('image_versions', 'N/A')
+                post_ver = post_app.get('image_versions', 'N/A')
                 
-                if pre_app.get('is_helm'):
-                    pre_ver = pre_app['chart_version']
+                if pre_ver != post_ver:
+                    status = "✅ Upgraded"
+                    apps_upgraded += 1
                 else:
-                    pre_ver = pre_app.get('image_versions', 'N/A')
-                
-                f.write(f"| {namespace} | {name} | {pre_ver} | - | ❌ Removed |\n")
-                apps_removed += 1
+                    status = "No change"
+                    apps_unchanged += 1
             
-            elif not pre_app and post_app:
-                namespace = post_app['namespace']
-                name = post_app['name']
-                
-                if post_app.get('is_helm'):
-                    post_ver = post_app['chart_version']
-                else:
-                    post_ver = post_app.get('image_versions', 'N/A')
-                
-                f.write(f"| {namespace} | {name} | - | {post_ver} | 🆕 Added |\n")
-                apps_added += 1
+            out.append(f"| {namespace} | {name} | {pre_ver} | {post_ver} | {status} |\n")
         
-        f.write("\n")
+        elif pre_app and not post_app:
+            namespace = pre_app['namespace']
+            name = pre_app['name']
+            
+            if pre_app.get('is_helm'):
+                pre_ver = pre_app['chart_version']
+            else:
+                pre_ver = pre_app.get('image_versions', 'N/A')
+            
+            out.append(f"| {namespace} | {name} | {pre_ver} | - | ❌ Removed |\n")
+            apps_removed += 1
         
-        # Summary
-        f.write("## Summary\n\n")
-        f.write(f"- **Kubernetes Components Changed:** {k8s_changed}\n")
-        f.write(f"- **Applications Upgraded:** {apps_upgraded}\n")
-        f.write(f"- **Applications Added:** {apps_added}\n")
-        f.write(f"- **Applications Removed:** {apps_removed}\n")
-        f.write(f"- **Applications Unchanged:** {apps_unchanged}\n")
+        elif not pre_app and post_app:
+            namespace = post_app['namespace']
+            name = post_app['name']
+            
+            if post_app.get('is_helm'):
+                post_ver = post_app['chart_version']
+            else:
+                post_ver = post_app.get('image_versions', 'N/A')
+            
+            out.append(f"| {namespace} | {name} | - | {post_ver} | 🆕 Added |\n")
+            apps_added += 1
+    
+    out.append("\n")
+    
+    # Summary
+    out.append("## Summary\n\n")
+    out.append(f"- **Kubernetes Components Changed:** {k8s_changed}\n")
+    out.append(f"- **Applications Upgraded:** {apps_upgraded}\n")
+    out.append(f"- **Applications Added:** {apps_added}\n")
+    out.append(f"- **Applications Removed:** {apps_removed}\n")
+    out.append(f"- **Applications Unchanged:** {apps_unchanged}\n")
+    
+    ensure_parent_dir(output_file)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(out))
     
     print(f"\nSimplified summary generated: {output_file}")
 
 
-def generate_diff_report(pre_data: Dict, post_data: Dict, output_file: str):
+def build_app_dict(data: Dict) -> Dict[str, AppRec]:
+    """
+    Build the application records of a snapshot for the diff report.
+    Returns: {namespace/name: AppRec}
+    """
+    apps = {}
+    helm_releases = data['helm_releases']
+    workloads = data['workloads']
+    
+    # Add Helm releases
+    for helm_key, helm_data in helm_releases.items():
+        app_name = f"{helm_data['namespace']}/{helm_data['name']}"
+        apps[app_name] = AppRec(
+            helm_data['namespace'],
+            helm_data['name'],
+            'Helm',
+            f"Chart: {helm_data['chart_version']}, App: {helm_data['app_version']}"
+        )
+    
+    # Add non-Helm workloads
+    helm_index = build_helm_index(helm_releases)
+    for workload_key, workload_data in workloads.items():
+        helm_key = is_helm_managed(workload_key, workload_data, helm_index)
+        if not helm_key:
+            apps[workload_key] = AppRec(
+                workload_data['namespace'],
+                workload_data['name'],
+                'Kubernetes',
+                ', '.join(get_image_versions(workload_data)) or 'N/A'
+            )
+    
+    return apps
+
+
+def generate_diff_report(pre_data: Dict, post_data: Dict, pre_apps: Dict[str, AppRec],
+                         post_apps: Dict[str, AppRec], output_file: str):
     """
     Generate a diff report comparing pre and post upgrade data.
+    pre_apps and post_apps are the build_app_dict() records of each snapshot.
     """
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    out = []
+    out.append("# Upgrade Diff Overview\n\n")
+    out.append("This document shows the differences between pre-upgrade and post-upgrade states.\n\n")
+    out.append(f"**Pre-upgrade timestamp:** {pre_data.get('timestamp', 'N/A')}\n\n")
+    out.append(f"**Post-upgrade timestamp:** {post_data.get('timestamp', 'N/A')}\n\n")
     
-    with open(output_file, 'w') as f:
-        f.write("# Upgrade Diff Overview\n\n")
-        f.write("This document shows the differences between pre-upgrade and post-upgrade states.\n\n")
-        f.write(f"**Pre-upgrade timestamp:** {pre_data.get('timestamp', 'N/A')}\n\n")
-        f.write(f"**Post-upgrade timestamp:** {post_data.get('timestamp', 'N/A')}\n\n")
-        
-        # Kubernetes Components Diff
-        f.write("## Kubernetes Components Changes\n\n")
-        f.write("| Component | Pre-Upgrade | Post-Upgrade | Status |\n")
-        f.write("|-----------|-------------|--------------|--------|\n")
-        
-        pre_k8s = pre_data['k8s_versions']
-        post_k8s = post_data['k8s_versions']
-        pre_etcd = pre_data['etcd_version']
-        post_etcd = post_data['etcd_version']
-        
-        # etcd
-        if pre_etcd != post_etcd:
-            f.write(f"| etcd | {pre_etcd} | {post_etcd} | ✅ **UPGRADED** |\n")
+    # Kubernetes Components Diff
+    out.append("## Kubernetes Components Changes\n\n")
+    out.append("| Component | Pre-Upgrade | Post-Upgrade | Status |\n")
+    out.append("|-----------|-------------|--------------|--------|\n")
+    
+    pre_k8s = pre_data['k8s_versions']
+    post_k8s = post_data['k8s_versions']
+    pre_etcd = pre_data['etcd_version']
+    post_etcd = post_data['etcd_version']
+    
+    # Changes are counted as the rows are written, for the summary at the end
+    components_changed = 0
+    apps_changed = 0
+    apps_added = 0
+    apps_removed = 0
+    
+    # etcd
+    if pre_etcd != post_etcd:
+        out.append(f"| etcd | {pre_etcd} | {post_etcd} | ✅ **UPGRADED** |\n")
+        components_changed += 1
+    else:
+        out.append(f"| etcd | {pre_etcd} | {post_etcd} | ➖ No change |\n")
+    
+    # Other components
+    all_components = pre_k8s.keys() | post_k8s.keys()
+    for component in sorted(all_components):
+        pre_ver = pre_k8s.get(component, 'N/A')
+        post_ver = post_k8s.get(component, 'N/A')
+        
+        if pre_ver == post_ver:
+            status = "➖ No change"
         else:
-            f.write(f"| etcd | {pre_etcd} | {post_etcd} | ➖ No change |\n")
-        
-        # Other components
-        all_components = set(pre_k8s.keys()) | set(post_k8s.keys())
-        for component in sorted(all_components):
-            pre_ver = pre_k8s.get(component, 'N/A')
-            post_ver = post_k8s.get(component, 'N/A')
-            
-            if pre_ver == 'N/A' and post_ver != 'N/A':
+            components_changed += 1
+            if pre_ver == 'N/A':
                 status = "🆕 **ADDED**"
-            elif pre_ver != 'N/A' and post_ver == 'N/A':
+            elif post_ver == 'N/A':
                 status = "❌ **REMOVED**"
-            elif pre_ver != post_ver:
-                status = "✅ **UPGRADED**"
             else:
-                status = "➖ No change"
-            
-            f.write(f"| {component} | {pre_ver} | {post_ver} | {status} |\n")
-        
-        f.write("\n")
-        
-        # Applications Diff
-        f.write("## Application Changes\n\n")
-        
-        # Build app dictionaries for both pre and post
-        def build_app_dict(data):
-            apps = {}
-            helm_releases = data['helm_releases']
-            workloads = data['workloads']
-            
-            # Add Helm releases
-            for helm_key, helm_data in helm_releases.items():
-                app_name = f"{helm_data['namespace']}/{helm_data['name']}"
-                apps[app_name] = {
-                    'namespace': helm_data['namespace'],
-                    'name': helm_data['name'],
-                    'source': 'Helm',
-                    'chart_version': helm_data['chart_version'],
-                    'app_version': helm_data['app_version']
-                }
-            
-            # Add non-Helm workloads
-            for workload_key, workload_data in workloads.items():
-                helm_key = is_helm_managed(workload_key, workload_data, helm_releases)
-                if not helm_key:
-                    images = workload_data.get('images', [])
-                    image_versions = [extract_version_from_image(img) for img in images]
-                    apps[workload_key] = {
-                        'namespace': workload_data['namespace'],
-                        'name': workload_data['name'],
-                        'source': 'Kubernetes',
-                        'image_versions': ', '.join(image_versions) if image_versions else 'N/A'
-                    }
-            
-            return apps
-        
-        pre_apps = build_app_dict(pre_data)
-        post_apps = build_app_dict(post_data)
-        
-        all_apps = set(pre_apps.keys()) | set(post_apps.keys())
+                status = "✅ **UPGRADED**"
         
-        f.write("| Namespace | Application | Source | Pre-Upgrade Version | Post-Upgrade Version | Status |\n")
-        f.write("|-----------|-------------|--------|---------------------|----------------------|--------|\n")
+        out.append(f"| {component} | {pre_ver} | {post_ver} | {status} |\n")
+    
+    out.append("\n")
+    
+    # Applications Diff
+    out.append("## Application Changes\n\n")
+    
+    all_apps = pre_apps.keys() | post_apps.keys()
+    
+    out.append("| Namespace | Application | Source | Pre-Upgrade Version | Post-Upgrade Version | Status |\n")
+    out.append("|-----------|-------------|--------|---------------------|----------------------|--------|\n")
+    
+    for app_key in sorted(all_apps):
+        pre_app = pre_apps.get(app_key)
+        post_app = post_apps.get(app_key)
         
-        for app_key in sorted(all_apps):
-            pre_app = pre_apps.get(app_key)
-            post_app = post_apps.get(app_key)
-            
-            if pre_app and post_app:
-                namespace = pre_app['namespace']
-                name = pre_app['name']
-                source = pre_app['source']
-                
-                if source == 'Helm':
-                    pre_ver = f"Chart: {pre_app['chart_version']}, App: {pre_app['app_version']}"
-                    post_ver = f"Chart: {post_app['chart_version']}, App: {post_app['app_version']}"
-                    
-                    if pre_app['chart_version'] != post_app['chart_version'] or pre_app['app_version'] != post_app['app_version']:
-                        status = "✅ **UPGRADED**"
-                    else:
-                        status = "➖ No change"
-                else:
-                    pre_ver = pre_app.get('image_versions', 'N/A')
-                    post_ver = post_app.get('image_versions', 'N/A')
-                    
-                    if pre_ver != post_ver:
-                        status = "✅ **UPGRADED**"
-                    else:
-                        status = "➖ No change"
-                
-                f.write(f"| {namespace} | {name} | {source} | {pre_ver} | {post_ver} | {status} |\n")
-            
-            elif pre_app and not post_app:
-                namespace = pre_app['namespace']
-                name = pre_app['name']
-                source = pre_app['source']
-                
-                if source == 'Helm':
-                    pre_ver = f"Chart: {pre_app['chart_version']}, App: {pre_app['app_version']}"
-                else:
-                    pre_ver = pre_app.get('image_versions', 'N/A')
-                
-                f.write(f"| {namespace} | {name} | {source} | {pre_ver} | - | ❌ **REMOVED** |\n")
+        if pre_app and post_app:
+            if pre_app.version != post_app.version:
+                status = "✅ **UPGRADED**"
+                apps_changed += 1
+            else:
+                status = "➖ No change"
             
-            elif not pre_app and post_app:
-                namespace = post_app['namespace']
-                name = post_app['name']
-                source = post_app['source']
-                
-                if source == 'Helm':
-                    post_ver = f"Chart: {post_app['chart_version']}, App: {post_app['app_version']}"
-                else:
-                    post_ver = post_app.get('image_versions', 'N/A')
-                
-                f.write(f"| {namespace} | {name} | {source} | - | {post_ver} | 🆕 **ADDED** |\n")
+            out.append(f"| {pre_app.namespace} | {pre_app.name} | {pre_app.source} | {pre_app.version} | {post_app.version} | {status} |\n")
         
-        f.write("\n")
+        elif pre_app:
+            out.append(f"| {pre_app.namespace} | {pre_app.name} | {pre_app.source} | {pre_app.version} | - | ❌ **REMOVED** |\n")
+            apps_removed += 1
         
-        # Summary
-        f.write("## Summary\n\n")
-        
-        # Count changes
-        components_changed = sum(1 for c in all_components if pre_k8s.get(c) != post_k8s.get(c))
-        if pre_etcd != post_etcd:
-            components_changed += 1
-        
-        apps_changed = 0
-        apps_added = 0
-        apps_removed = 0
-        
-        for app_key in all_apps:
-            pre_app = pre_apps.get(app_key)
-            post_app = post_apps.get(app_key)
-            
-            if pre_app and post_app:
-                if pre_app.get('chart_version') != post_app.get('chart_version') or \
-                   pre_app.get('app_version') != post_app.get('app_version') or \
-                   pre_app.get('image_versions') != post_app.get('image_versions'):
-                    apps_changed += 1
-            elif not pre_app:
-                apps_added += 1
-            elif not post_app:
-                apps_removed += 1
-        
-        f.write(f"- **Kubernetes Components Changed**: {components_changed}\n")
-        f.write(f"- **Applications Upgraded**: {apps_changed}\n")
-        f.write(f"- **Applications Added**: {apps_added}\n")
-        f.write(f"- **Applications Removed**: {apps_removed}\n")
+        else:
+            out.append(f"| {post_app.namespace} | {post_app.name} | {post_app.source} | - | {post_app.version} | 🆕 **ADDED** |\n")
+            apps_added += 1
+    
+    out.append("\n")
+    
+    # Summary
+    out.append("## Summary\n\n")
+    
+    out.append(f"- **Kubernetes Components Changed**: {components_changed}\n")
+    out.append(f"- **Applications Upgraded**: {apps_changed}\n")
+    out.append(f"- **Applications Added**: {apps_added}\n")
+    out.append(f"- **Applications Removed**: {apps_removed}\n")
+    
+    ensure_parent_dir(output_file)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(out))
     
     print(f"\nDiff report generated: {output_file}")
 
@@ -938,9 +1039,15 @@ def main():
     group.add_argument('--post', action='store_true', help='Collect post-upgrade snapshot')
     group.add_argument('--diff', action='store_true', help='Generate diff report comparing pre and post snapshots')
     group.add_argument('--summary', action='store_true', help='Generate simplified summary (consolidates multi-component apps)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Reuse data collected from the same cluster within the last few minutes '
+                             f'(cached in {CACHE_DIR}); not for snapshots taken right after an upgrade')
     
     args = parser.parse_args()
     
+    global USE_CACHE
+    USE_CACHE = args.cache
+    
     logs_dir = ".logs"
     
     if args.pre:
@@ -991,8 +1098,11 @@ def main():
             print("Error: Post-upgrade data not found. Please run with --post first.")
             return 1
         
+        pre_apps = build_app_dict(pre_data)
+        post_apps = build_app_dict(post_data)
+        
         print("\nGenerating diff report...")
-        generate_diff_report(pre_data, post_data, f"{logs_dir}/diff-overview.md")
+        generate_diff_report(pre_data, post_data, pre_apps, post_apps, f"{logs_dir}/diff-overview.md")
         
         print("\n" + "=" * 50)
         print("Done!")